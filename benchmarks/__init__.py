@@ -0,0 +1,11 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmarks for the hot paths of :mod:`parse_type` (runnable offline).
+
+USAGE::
+
+    python -m benchmarks --output=build/benchmarks/current.json
+    python -m benchmarks --compare=build/benchmarks/baseline.json
+
+SEE ALSO: :mod:`benchmarks.runner`
+"""
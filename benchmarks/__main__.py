@@ -0,0 +1,61 @@
+# -*- coding: UTF-8 -*-
+"""
+Run the benchmarks and store/compare the results (as JSON file).
+
+USAGE::
+
+    python -m benchmarks [--output=FILE] [--compare=FILE] [PREFIX ...]
+"""
+
+from __future__ import absolute_import, print_function
+import argparse
+import sys
+from benchmarks import runner
+from benchmarks import bench_parse, bench_types     # noqa: F401 -- REGISTER
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description=__doc__.strip().split("\n")[0])
+    parser.add_argument("names", nargs="*", metavar="PREFIX",
+                        help="Select benchmarks by name prefix (default: all).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Store results in this JSON file.")
+    parser.add_argument("-c", "--compare", default=None,
+                        help="Compare with results of this JSON file.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio that counts as regression (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Minimum time per benchmark in seconds.")
+    parser.add_argument("-l", "--list", action="store_true",
+                        help="List the benchmarks (without running them).")
+    options = parser.parse_args(args)
+
+    benchmarks = runner.select_benchmarks(options.names)
+    if options.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+
+    data = runner.run_benchmarks(benchmarks, repeat=options.repeat,
+                                 min_time=options.min_time,
+                                 stream=None if options.compare else sys.stdout)
+    if options.output:
+        runner.save_results(data, options.output)
+    status = 0
+    if options.compare:
+        baseline = runner.load_results(options.compare)
+        regressions = runner.compare_results(baseline, data,
+                                             threshold=options.threshold)
+        if regressions:
+            print("REGRESSIONS: %s" % ", ".join(regressions))
+            status = 1
+    if data["errors"]:
+        print("ERRORS: %s" % ", ".join(data["errors"]))
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
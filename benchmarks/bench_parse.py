@@ -0,0 +1,107 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmarks for :mod:`parse_type.parse`: Parser construction, regex compile,
+parse/search/findall per type family and memory per :class:`Result`.
+"""
+
+from __future__ import absolute_import
+import re
+from parse_type import parse
+from benchmarks.runner import benchmark, memory_benchmark
+
+
+FORMAT = "{level:w} {when:ti} {user:w} {status:d} {size:d} {elapsed:f}"
+TEXT = "INFO 2023-11-21T13:23:27+01:00 alice 200 5120 0.125"
+
+# -- TYPE FAMILIES: format, text
+TYPE_FAMILIES = [
+    ("numbers", "{:d} {:n} {:x} {:f}", "42 1,234,567 ff 3.14"),
+    ("strings", "{:w} {} {:S}", "alice hello world /index.html"),
+    ("dates.ti", "{:ti}", "2023-11-21T13:23:27+01:00"),
+    ("dates.tg", "{:tg}", "21/11/2023 13:23:27 +01:00"),
+    ("dates.strftime", "{:%Y-%m-%d %H:%M:%S}", "2023-11-21 13:23:27"),
+]
+
+
+def make_lines(count=1000):
+    return "\n".join("line %d: %s" % (index, TEXT) for index in range(count))
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS: Parser construction and regex compile
+# -----------------------------------------------------------------------------
+@benchmark("parser.construct")
+def bench_parser_construct():
+    return lambda: parse.Parser(FORMAT)
+
+
+@benchmark("parser.first_match")
+def bench_parser_first_match():
+    # -- INCLUDES: Compiling the regex (without re module cache).
+    def first_match():
+        re.purge()
+        parse.Parser(FORMAT).parse(TEXT)
+    return first_match
+
+
+@benchmark("parser.cached.parse")
+def bench_parser_cached_parse():
+    # -- USES: Module-level parser cache.
+    return lambda: parse.parse(FORMAT, TEXT)
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS: parse/search/findall per type family
+# -----------------------------------------------------------------------------
+def _register_type_family(name, format, text):
+    @benchmark("parse.%s" % name)
+    def bench_parse():
+        parser = parse.Parser(format)
+        return lambda: parser.parse(text)
+
+    @benchmark("search.%s" % name)
+    def bench_search():
+        parser = parse.Parser(format)
+        search_text = "%s %s" % ("x" * 100, text)
+        return lambda: parser.search(search_text)
+
+for _name, _format, _text in TYPE_FAMILIES:
+    _register_type_family(_name, _format, _text)
+
+
+@benchmark("findall.log_lines")
+def bench_findall_log_lines():
+    parser = parse.Parser(FORMAT)
+    text = make_lines(1000)
+    return lambda: list(parser.findall(text))
+
+
+@benchmark("parse_many.log_lines")
+def bench_parse_many_log_lines():
+    parser = parse.Parser("line {:d}: " + FORMAT)
+    lines = make_lines(1000).splitlines()
+    return lambda: list(parser.parse_many(lines))
+
+
+@benchmark("parser_set.parse")
+def bench_parser_set_parse():
+    # -- LAST FORMAT MATCHES: Worst case for the combined regex.
+    parser_set = parse.ParserSet(
+        [format for _, format, _ in TYPE_FAMILIES] + [FORMAT]
+    )
+    return lambda: parser_set.parse(TEXT)
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS: Memory per Result
+# -----------------------------------------------------------------------------
+@memory_benchmark("memory.result")
+def bench_memory_result():
+    parser = parse.Parser(FORMAT)
+    return lambda: parser.parse(TEXT)
+
+
+@memory_benchmark("memory.result_without_spans")
+def bench_memory_result_without_spans():
+    parser = parse.Parser(FORMAT)
+    return lambda: parser.parse(TEXT, spans=False)
@@ -0,0 +1,74 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmarks for the type converters of :class:`parse_type.TypeBuilder`
+(cardinality, choice, enum, variant) and for :class:`parse_type.cfparse.Parser`
+(creation of type variants for cardinality fields).
+"""
+
+from __future__ import absolute_import
+from parse_type import TypeBuilder
+from parse_type import parse
+from parse_type.cfparse import Parser as CFParser
+from benchmarks.runner import benchmark
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+COLORS = ["red", "green", "blue", "cyan", "magenta", "yellow", "black", "white"]
+parse_color = TypeBuilder.make_choice(COLORS)
+parse_yesno = TypeBuilder.make_enum({"yes": True, "no": False,
+                                     "on": True, "off": False})
+parse_number_or_color = TypeBuilder.make_variant([parse_number, parse_color])
+
+TYPES = {
+    "Number": parse_number,
+    "Numbers": TypeBuilder.with_many(parse_number),
+    "Color": parse_color,
+    "YesNo": parse_yesno,
+    "NumberOrColor": parse_number_or_color,
+}
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS: TypeBuilder type converters
+# -----------------------------------------------------------------------------
+def _register_parse_benchmark(name, format, text):
+    @benchmark("types.%s" % name)
+    def bench_parse():
+        parser = parse.Parser(format, TYPES)
+        return lambda: parser.parse(text)
+
+_register_parse_benchmark("cardinality.many", "{:Numbers}",
+                          ", ".join(str(i) for i in range(20)))
+_register_parse_benchmark("choice", "{:Color}", "magenta")
+_register_parse_benchmark("enum", "{:YesNo}", "off")
+_register_parse_benchmark("variant.first", "{:NumberOrColor}", "42")
+_register_parse_benchmark("variant.last", "{:NumberOrColor}", "white")
+
+
+@benchmark("types.make_choice")
+def bench_make_choice():
+    return lambda: TypeBuilder.make_choice(COLORS)
+
+
+@benchmark("types.make_variant")
+def bench_make_variant():
+    converters = [parse_number, parse_color, parse_yesno]
+    return lambda: TypeBuilder.make_variant(converters)
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS: cfparse.Parser (type variants for cardinality fields)
+# -----------------------------------------------------------------------------
+@benchmark("cfparse.construct")
+def bench_cfparse_construct():
+    format = "{a:Number?} {b:Number*} {c:Number+} {d:Color+}"
+    return lambda: CFParser(format, dict(TYPES))
+
+
+@benchmark("cfparse.parse")
+def bench_cfparse_parse():
+    parser = CFParser("{numbers:Number+} {colors:Color*}", dict(TYPES))
+    return lambda: parser.parse("1, 2, 3 red, green")
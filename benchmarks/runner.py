@@ -0,0 +1,230 @@
+# -*- coding: UTF-8 -*-
+"""
+Minimal benchmark runner (only uses the Python standard library).
+
+Benchmarks are registered with the :func:`benchmark` decorator
+(time per call) or the :func:`memory_benchmark` decorator
+(allocated bytes per object). The results are stored as JSON file
+that can be compared with the results of another commit.
+
+.. code-block:: python
+
+    from benchmarks.runner import benchmark
+
+    @benchmark("parse.number")
+    def bench_parse_number():
+        parser = Parser("{:d}")     # -- SETUP: Not measured.
+        return lambda: parser.parse("42")
+"""
+
+from __future__ import absolute_import, print_function
+from collections import OrderedDict
+import gc
+import json
+import os.path
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARK REGISTRY:
+# -----------------------------------------------------------------------------
+BENCHMARKS = OrderedDict()
+
+
+class Benchmark(object):
+    """Registered benchmark.
+
+    :param name:    Name of the benchmark (as: "<group>.<case>").
+    :param setup:   Function that returns the function to measure.
+    :param kind:    Kind of measurement: "time" or "memory".
+    :param number:  Number of objects (kind: "memory").
+    """
+    def __init__(self, name, setup, kind="time", number=None):
+        self.name = name
+        self.setup = setup
+        self.kind = kind
+        self.number = number
+
+    @property
+    def unit(self):
+        if self.kind == "memory":
+            return "bytes"
+        return "seconds"
+
+    def run(self, repeat=5, min_time=0.2):
+        if self.kind == "memory":
+            return self.run_memory()
+        return self.run_time(repeat=repeat, min_time=min_time)
+
+    def run_time(self, repeat=5, min_time=0.2):
+        func = self.setup()
+        timer = timeit.Timer(func)
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time / repeat or number >= 10**7:
+                break
+            number *= 10
+        timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+        return OrderedDict([
+            ("kind", self.kind),
+            ("unit", self.unit),
+            ("value", min(timings)),
+            ("mean", sum(timings) / len(timings)),
+            ("max", max(timings)),
+            ("number", number),
+            ("repeat", repeat),
+        ])
+
+    def run_memory(self):
+        make_object = self.setup()
+        number = self.number or 10000
+        make_object()   # -- WARM-UP: Lazy compiled regex, caches, ...
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            objects = [make_object() for _ in range(number)]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del objects
+        return OrderedDict([
+            ("kind", self.kind),
+            ("unit", self.unit),
+            ("value", (after - before) / float(number)),
+            ("number", number),
+        ])
+
+
+def benchmark(name):
+    """Decorator to register a time benchmark.
+    The decorated function performs the setup and returns the function
+    that is measured (time per call).
+    """
+    def decorator(func):
+        BENCHMARKS[name] = Benchmark(name, func, kind="time")
+        return func
+    return decorator
+
+
+def memory_benchmark(name, number=10000):
+    """Decorator to register a memory benchmark.
+    The decorated function performs the setup and returns a function
+    that creates one object (allocated bytes per object are measured).
+    """
+    def decorator(func):
+        BENCHMARKS[name] = Benchmark(name, func, kind="memory", number=number)
+        return func
+    return decorator
+
+
+def select_benchmarks(patterns=None):
+    """Select the registered benchmarks by name prefix (or all)."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    return [bench for name, bench in BENCHMARKS.items()
+            if any(name.startswith(pattern) for pattern in patterns)]
+
+
+# -----------------------------------------------------------------------------
+# RESULTS: JSON file
+# -----------------------------------------------------------------------------
+def git_revision():
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(__file__)))
+        return output.decode("ascii").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_metadata():
+    return OrderedDict([
+        ("revision", git_revision()),
+        ("python", platform.python_version()),
+        ("implementation", platform.python_implementation()),
+        ("platform", platform.platform()),
+        ("machine", platform.machine()),
+    ])
+
+
+def run_benchmarks(benchmarks, repeat=5, min_time=0.2, stream=sys.stdout):
+    """Run the benchmarks. A failing benchmark does not stop the others;
+    its error is reported and stored in "errors" (instead of "results").
+    """
+    results = OrderedDict()
+    errors = OrderedDict()
+    for bench in benchmarks:
+        try:
+            result = bench.run(repeat=repeat, min_time=min_time)
+        except Exception as e:  # pylint: disable=broad-except
+            errors[bench.name] = "%s: %s" % (e.__class__.__name__, e)
+            if stream:
+                stream.write("%-40s ERROR: %s\n" % (bench.name, errors[bench.name]))
+            continue
+        results[bench.name] = result
+        if stream:
+            stream.write("%-40s %s\n" % (bench.name, format_value(result)))
+    return OrderedDict([("metadata", make_metadata()), ("results", results),
+                        ("errors", errors)])
+
+
+def save_results(data, filename):
+    directory = os.path.dirname(filename)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(filename, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def load_results(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def format_value(result):
+    value = result["value"]
+    if result["unit"] == "bytes":
+        return "%10.1f bytes" % value
+    return "%10.3f usec" % (value * 1e6)
+
+
+# -----------------------------------------------------------------------------
+# COMPARE: Results of two runs (commits)
+# -----------------------------------------------------------------------------
+def compare_results(baseline, current, threshold=1.25, stream=sys.stdout):
+    """Compare the current results with baseline results.
+
+    :param baseline:  Baseline results (as data of JSON file).
+    :param current:   Current results (as data of JSON file).
+    :param threshold: Ratio (current/baseline) that counts as regression.
+    :return: List of names of benchmarks with a regression.
+    """
+    regressions = []
+    baseline_results = baseline["results"]
+    for name, result in current["results"].items():
+        baseline_result = baseline_results.get(name)
+        if baseline_result is None or not baseline_result["value"]:
+            ratio = None
+            marker = "NEW"
+        else:
+            ratio = result["value"] / baseline_result["value"]
+            marker = ""
+            if ratio >= threshold:
+                marker = "REGRESSION"
+                regressions.append(name)
+            elif ratio <= 1.0 / threshold:
+                marker = "IMPROVED"
+        if stream:
+            ratio_text = "%6.2fx" % ratio if ratio is not None else "      "
+            stream.write("%-40s %s %s %s\n" % (
+                name, format_value(result), ratio_text, marker))
+    return regressions
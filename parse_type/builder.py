@@ -67,10 +67,226 @@ import re
 import enum
 from parse_type.cardinality import pattern_group_count, \
     Cardinality, TypeBuilder as CardinalityTypeBuilder
+from parse_type.registry import type_ref
 
 __all__ = ["TypeBuilder", "build_type_dict", "parse_anything"]
 
 
+# -----------------------------------------------------------------------------
+# TYPE CONVERTER CLASSES: Used by the TypeBuilder (picklable)
+# -----------------------------------------------------------------------------
+_TRIE_END = ""  # -- MARKER: End of a name (no single character).
+
+
+def make_alternatives_pattern(names):
+    """Make the regex pattern for alternative names (as character trie).
+    The names are escaped and names with a common prefix share it,
+    like: "apple|ant" -> "a(?:pple|nt)". A name that is a prefix of another
+    name is made optional (greedy), so that the longest name matches first.
+    Only non-capturing groups are used (regex_group_count is zero).
+
+    :param names:  Names to match (as iterable of strings).
+    :return: Regular expression pattern for these names.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = None
+    return _make_trie_pattern(trie, outermost=True)
+
+
+def _make_trie_pattern(node, outermost=False):
+    alternatives = []
+    for char in sorted(key for key in node if key != _TRIE_END):
+        # -- COMPRESS: Chain of characters without branches.
+        text = re.escape(char)
+        child = node[char]
+        while len(child) == 1 and _TRIE_END not in child:
+            char, child = next(iter(child.items()))
+            text += re.escape(char)
+        if len(child) > 1 or _TRIE_END not in child:
+            text += _make_trie_pattern(child)
+        alternatives.append(text)
+
+    pattern = r"|".join(alternatives)
+    if _TRIE_END in node:
+        # -- OPTIONAL SUFFIX: Greedy, tries the longer names first.
+        if alternatives:
+            pattern = r"(?:%s)?" % pattern
+    elif len(alternatives) > 1 and not outermost:
+        pattern = r"(?:%s)" % pattern
+    return pattern
+
+
+class EnumTypeConverter(object):
+    """Type converter for an enumeration or text-to-value mapping.
+    The names are looked up in a dictionary (exact case first)
+    and in a dictionary with case-folded names (REQUIRED-BY: re.IGNORECASE).
+    """
+
+    def __init__(self, enum_mappings):
+        self.enum_spec = enum_mappings
+        if (inspect.isclass(enum_mappings) and
+                issubclass(enum_mappings, enum.Enum)):
+            enum_mappings = enum_mappings.__members__
+        self.mappings = enum_mappings
+        self.pattern = make_alternatives_pattern(enum_mappings.keys())
+        self._index = dict(enum_mappings)
+        self._folded_index = {}
+        for name, value in self._index.items():
+            self._folded_index.setdefault(name.lower(), value)
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        try:
+            return self._index[text]
+        except KeyError:
+            # -- REQUIRED-BY: parse re.IGNORECASE
+            return self._folded_index[text.lower()]
+
+    def __reduce__(self):
+        return (self.__class__, (self.enum_spec,), _extra_state(self))
+
+
+class ChoiceTypeConverter(object):
+    """Type converter to select one from a list of strings.
+    Returns the selected choice text.
+
+    The choices are looked up in a dictionary (exact case) and,
+    if not strict, in a dictionary with case-folded choices
+    (REQUIRED-BY: re.IGNORECASE).
+    """
+
+    def __init__(self, choices, transform=None, strict=True):
+        # -- REQUIRES: Normalized choices (transform is already applied).
+        self.choices = choices
+        self._transform = transform
+        self.strict = strict
+        self.pattern = make_alternatives_pattern(choices)
+        self._choices_index = {}
+        self._folded_index = {}
+        for index, choice in enumerate(choices):
+            self._choices_index.setdefault(choice, index)
+            self._folded_index.setdefault(choice.lower(), index)
+
+    def select(self, text):
+        if self._transform:
+            text = self._transform(text)
+        if self.strict and text not in self._choices_index:
+            values = ", ".join(self.choices)
+            raise ValueError("%s not in: %s" % (text, values))
+        return text
+
+    def index_of(self, text):
+        """Return the index of the (selected) choice text or None."""
+        index = self._choices_index.get(text)
+        if index is None and not self.strict:
+            # -- REQUIRED-BY: parse re.IGNORECASE
+            index = self._folded_index.get(text.lower())
+        return index
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        return self.select(text)
+
+    def __reduce__(self):
+        args = (self.choices, type_ref(self._transform), self.strict)
+        return (self.__class__, args, _extra_state(self))
+
+
+class Choice2TypeConverter(ChoiceTypeConverter):
+    """Type converter to select one from a list of strings.
+    Returns a tuple (index, choice_text).
+    """
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        text = self.select(text)
+        index = self.index_of(text)
+        if index is None:
+            raise ValueError("%r is not in list" % text)
+        return index, text
+
+
+class VariantTypeConverter(object):
+    """Type converter for a number of type converter alternatives.
+    The first matching type converter is used.
+
+    If the match and the group number of the field are provided
+    (by :class:`parse_type.parse.Parser`), the type converter of the
+    alternative group that participated in the match is used directly
+    (without matching the text again). This requires ``re.IGNORECASE``
+    in ``re_opts`` (default), like the Parser uses it.
+    """
+    use_match_groups = True
+
+    def __init__(self, converters, re_opts, compiled=False, strict=True):
+        self.converters = tuple(converters)
+        self.re_opts = re_opts
+        self.compiled = compiled
+        self.strict = strict
+        pattern = r")|(".join([tc.pattern for tc in converters])
+        self.pattern = r"("+ pattern + ")"
+
+        # -- DISPATCH TABLE: Group offset of each alternative (to field group).
+        # The regex_group_count is derived from the same group offsets.
+        alternatives = []
+        group_offset = 1
+        for converter in self.converters:
+            alternatives.append((group_offset, converter,
+                                 getattr(converter, "use_match_groups", False)))
+            group_offset += 1 + pattern_group_count(converter.pattern)
+        self.alternatives = tuple(alternatives)
+        self.regex_group_count = group_offset - 1
+        self._dispatch_by_group = bool(re_opts & re.IGNORECASE)
+        if compiled:
+            # -- USE: Compiled regular expression matcher.
+            for converter in converters:
+                matcher = getattr(converter, "matcher", None)
+                if not matcher:
+                    converter.matcher = re.compile(converter.pattern, re_opts)
+
+    def __call__(self, text, m=None, group=None):
+        # pylint: disable=invalid-name, unused-argument
+        if (self._dispatch_by_group and m is not None and group is not None
+                and m.group(group) == text):
+            # -- FAST-PATH: Use the alternative group that has matched.
+            for offset, converter, use_match_groups in self.alternatives:
+                if m.group(group + offset) is not None:
+                    if use_match_groups:
+                        return converter(text, m, group + offset)
+                    return converter(text)
+
+        # -- NOTE: Uses double-dispatch with regex pattern rematch because
+        #          match is not passed through to primary type converter.
+        if self.compiled:
+            for converter in self.converters:
+                if converter.matcher.match(text):
+                    return converter(text)
+        else:
+            # -- USE: Regular expression pattern (compiled on use).
+            for converter in self.converters:
+                if re.match(converter.pattern, text, self.re_opts):
+                    return converter(text)
+        # -- pragma: no cover
+        assert not self.strict, "OOPS-VARIANT-MISMATCH: %s" % text
+        return None
+
+    def __reduce__(self):
+        converters = tuple(type_ref(converter) for converter in self.converters)
+        args = (converters, self.re_opts, self.compiled, self.strict)
+        return (self.__class__, args, _extra_state(self))
+
+
+def _extra_state(converter):
+    # -- PICKLE SUPPORT: Keep optional "name" attribute of a type converter.
+    if "name" in converter.__dict__:
+        return {"name": converter.name}
+    return {}
+
+
 class TypeBuilder(CardinalityTypeBuilder):
     """
     Provides a utility class to build type-converters (parse_types) for
@@ -103,18 +319,7 @@ class TypeBuilder(CardinalityTypeBuilder):
         :param enum_mappings: Defines enumeration names and values.
         :return: Type converter function object for the enum/mapping.
         """
-        if (inspect.isclass(enum_mappings) and
-                issubclass(enum_mappings, enum.Enum)):
-            enum_class = enum_mappings
-            enum_mappings = enum_class.__members__
-
-        def convert_enum(text):
-            if text not in convert_enum.mappings:
-                text = text.lower()     # REQUIRED-BY: parse re.IGNORECASE
-            return convert_enum.mappings[text]    #< text.lower() ???
-        convert_enum.pattern = r"|".join(enum_mappings.keys())
-        convert_enum.mappings = enum_mappings
-        return convert_enum
+        return EnumTypeConverter(enum_mappings)
 
     @staticmethod
     def _normalize_choices(choices, transform):
@@ -142,17 +347,7 @@ class TypeBuilder(CardinalityTypeBuilder):
         choices = cls._normalize_choices(choices, transform)
         if strict is None:
             strict = cls.default_strict
-
-        def convert_choice(text):
-            if transform:
-                text = transform(text)
-            if strict and text not in convert_choice.choices:
-                values = ", ".join(convert_choice.choices)
-                raise ValueError("%s not in: %s" % (text, values))
-            return text
-        convert_choice.pattern = r"|".join(choices)
-        convert_choice.choices = choices
-        return convert_choice
+        return ChoiceTypeConverter(choices, transform, strict)
 
     @classmethod
     def make_choice2(cls, choices, transform=None, strict=None):
@@ -167,18 +362,7 @@ class TypeBuilder(CardinalityTypeBuilder):
         choices = cls._normalize_choices(choices, transform)
         if strict is None:
             strict = cls.default_strict
-
-        def convert_choice2(text):
-            if transform:
-                text = transform(text)
-            if strict and text not in convert_choice2.choices:
-                values = ", ".join(convert_choice2.choices)
-                raise ValueError("%s not in: %s" % (text, values))
-            index = convert_choice2.choices.index(text)
-            return index, text
-        convert_choice2.pattern = r"|".join(choices)
-        convert_choice2.choices = choices
-        return convert_choice2
+        return Choice2TypeConverter(choices, transform, strict)
 
     @classmethod
     def make_variant(cls, converters, re_opts=None, compiled=False, strict=True):
@@ -202,61 +386,12 @@ class TypeBuilder(CardinalityTypeBuilder):
             Otherwise, you need to use :class:`parse_type.parse.Parser`
             (patched version of the :mod:`parse` module).
         """
-        # -- NOTE: Uses double-dispatch with regex pattern rematch because
-        #          match is not passed through to primary type converter.
         assert converters, "REQUIRE: Non-empty list."
         if len(converters) == 1:
             return converters[0]
         if re_opts is None:
             re_opts = cls.default_re_opts
-
-        pattern = r")|(".join([tc.pattern for tc in converters])
-        pattern = r"("+ pattern + ")"
-        group_count = len(converters)
-        for converter in converters:
-            group_count += pattern_group_count(converter.pattern)
-
-        if compiled:
-            convert_variant = cls.__create_convert_variant_compiled(converters,
-                                                                    re_opts,
-                                                                    strict)
-        else:
-            convert_variant = cls.__create_convert_variant(re_opts, strict)
-        convert_variant.pattern = pattern
-        convert_variant.converters = tuple(converters)
-        convert_variant.regex_group_count = group_count
-        return convert_variant
-
-    @staticmethod
-    def __create_convert_variant(re_opts, strict):
-        # -- USE: Regular expression pattern (compiled on use).
-        def convert_variant(text, m=None):
-            # pylint: disable=invalid-name, unused-argument, missing-docstring
-            for converter in convert_variant.converters:
-                if re.match(converter.pattern, text, re_opts):
-                    return converter(text)
-            # -- pragma: no cover
-            assert not strict, "OOPS-VARIANT-MISMATCH: %s" % text
-            return None
-        return convert_variant
-
-    @staticmethod
-    def __create_convert_variant_compiled(converters, re_opts, strict):
-        # -- USE: Compiled regular expression matcher.
-        for converter in converters:
-            matcher = getattr(converter, "matcher", None)
-            if not matcher:
-                converter.matcher = re.compile(converter.pattern, re_opts)
-
-        def convert_variant(text, m=None):
-            # pylint: disable=invalid-name, unused-argument, missing-docstring
-            for converter in convert_variant.converters:
-                if converter.matcher.match(text):
-                    return converter(text)
-            # -- pragma: no cover
-            assert not strict, "OOPS-VARIANT-MISMATCH: %s" % text
-            return None
-        return convert_variant
+        return VariantTypeConverter(converters, re_opts, compiled, strict)
 
 
 def build_type_dict(converters):
@@ -7,14 +7,28 @@ for a data type with the specified cardinality.
 # -- USE: enum34
 from __future__ import absolute_import
 from enum import Enum
+from functools import partial
+import re
+from parse_type.registry import type_ref
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS:
 # -----------------------------------------------------------------------------
 def pattern_group_count(pattern):
-    """Count the pattern-groups within a regex-pattern (as text)."""
-    return pattern.replace(r"\(", "").count("(")
+    """Count the (capturing) pattern-groups within a regex-pattern.
+    Non-capturing groups, like "(?:...)", are not counted.
+    """
+    try:
+        return re.compile(pattern).groups
+    except re.error:
+        # -- FALLBACK: Count the groups in the regex-pattern (as text).
+        return pattern.replace(r"\(", "").count("(")
+
+
+def map_list(converter, texts):
+    """Convert each text with the type converter (default bulk conversion)."""
+    return list(map(converter, texts))
 
 
 # -----------------------------------------------------------------------------
@@ -67,6 +81,21 @@ class Cardinality(Enum):
         # -- OTHERWISE:
         return self.schema % (pattern, listsep, pattern)
 
+    def make_items_pattern(self, pattern, listsep=','):
+        """Make the pattern that captures the items of a list text
+        (for Cardinality.zero_or_more, Cardinality.one_or_more).
+        Each item is captured by its pattern (as group 1) if it is followed
+        by the list separator or the end of the text. Therefore, an item
+        may contain the list separator (if its pattern allows it).
+
+        :param pattern:  Regular expression for an item (as string).
+        :param listsep:  List separator for multiple items (as string, optional)
+        :return: Regular expression pattern for the items (with finditer()).
+        """
+        assert self.is_many()
+        return r"(?:\A\s*|\s*%s\s*)(%s)(?=\s*%s|\s*\Z)" % (
+            listsep, pattern, listsep)
+
     def compute_group_count(self, pattern):
         """Compute the number of regexp match groups when the pattern is provided
         to the :func:`Cardinality.make_pattern()` method.
@@ -81,6 +110,139 @@ class Cardinality(Enum):
         return group_count + pattern_repeated * pattern_group_count(pattern)
 
 
+# -----------------------------------------------------------------------------
+# CLASSES: Type converters with cardinality
+# -----------------------------------------------------------------------------
+class CardinalityTypeConverter(object):
+    """Base class of type converters for a data type T with a cardinality.
+    The type converter is based on the type converter for T (cardinality=1).
+
+    A type converter is pickled by its declarative spec:
+    the item type converter (or its name, if registered in the type registry),
+    the item pattern and the list separator.
+
+    BULK CONVERSION: If the item type converter provides a ``convert_many``
+    function, it is called once with the list of all item texts
+    (instead of calling the item type converter for each item).
+
+    .. code-block:: python
+
+        def parse_number(text):
+            return int(text)
+        parse_number.pattern = r"\\d+"
+        parse_number.convert_many = lambda texts: list(map(int, texts))
+
+    CAPTURE MODE: If ``capture`` is true, the items of a list are captured
+    by the item pattern (instead of splitting the text at each list separator).
+    Use it if an item may contain the list separator, like: "1,5, 2,5".
+    """
+    cardinality = None
+
+    def __init__(self, converter, pattern, listsep=",", capture=False):
+        self.converter = converter
+        self.item_pattern = pattern
+        self.listsep = listsep
+        self.capture = capture
+        self.pattern = self.cardinality.make_pattern(pattern, listsep)
+        self.regex_group_count = self.cardinality.compute_group_count(pattern)
+        self.items_regex = None
+        self._items_regex_ignorecase = None
+        if capture and self.cardinality.is_many():
+            items_pattern = self.cardinality.make_items_pattern(pattern, listsep)
+            self.items_regex = re.compile(items_pattern, re.DOTALL)
+        self._convert_many = getattr(converter, "convert_many", None)
+        if self._convert_many is None:
+            self._convert_many = partial(map_list, converter)
+
+    def convert_items(self, text):
+        """Split the list text into its items and convert all items.
+        NOTE: str.split() with str.strip() is faster than a regex pass
+        (finditer/findall with the item pattern) for large lists.
+        """
+        items = None
+        if self.items_regex is not None:
+            items = self.capture_items(text)
+            if items is None:
+                # -- CASE-INSENSITIVE PARSER: Text may be matched in other case.
+                items = self.capture_items(text, self.items_regex_ignorecase)
+        if items is None:
+            items = list(map(str.strip, text.split(self.listsep)))
+        return self._convert_many(items)
+
+    @property
+    def items_regex_ignorecase(self):
+        """Case-insensitive variant of the items_regex (compiled on first use)."""
+        if self._items_regex_ignorecase is None:
+            self._items_regex_ignorecase = re.compile(
+                self.items_regex.pattern, re.IGNORECASE | re.DOTALL)
+        return self._items_regex_ignorecase
+
+    def capture_items(self, text, items_regex=None):
+        """Capture the items of a list text with the item pattern (one pass).
+
+        :param items_regex: Regex to use (default: items_regex).
+        :return: List of item texts (or None, if the items do not cover the text).
+        """
+        if items_regex is None:
+            items_regex = self.items_regex
+        items = []
+        pos = 0
+        for m in items_regex.finditer(text):
+            if m.start() != pos:
+                return None
+            items.append(m.group(1))
+            pos = m.end()
+        if not items or text[pos:].strip():
+            return None
+        return items
+
+    def __reduce__(self):
+        args = (type_ref(self.converter), self.item_pattern, self.listsep,
+                self.capture)
+        state = {}
+        if "name" in self.__dict__:
+            state["name"] = self.name
+        return (self.__class__, args, state)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.pattern)
+
+
+class ZeroOrOneTypeConverter(CardinalityTypeConverter):
+    """Type converter for optional<T> (T or None)."""
+    cardinality = Cardinality.zero_or_one
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        if text:
+            text = text.strip()
+        if not text:
+            return None
+        return self.converter(text)
+
+
+class ZeroOrMoreTypeConverter(CardinalityTypeConverter):
+    """Type converter for list<T> with 0..N items."""
+    cardinality = Cardinality.zero_or_more
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        if text:
+            text = text.strip()
+        if not text:
+            return []
+        return self.convert_items(text)
+
+
+class OneOrMoreTypeConverter(CardinalityTypeConverter):
+    """Type converter for list<T> with 1..N items."""
+    cardinality = Cardinality.one_or_more
+
+    def __call__(self, text, m=None):
+        # pylint: disable=invalid-name, unused-argument
+        return self.convert_items(text)
+
+
 # -----------------------------------------------------------------------------
 # CLASS: TypeBuilder
 # -----------------------------------------------------------------------------
@@ -94,13 +256,14 @@ class TypeBuilder(object):
 
     @classmethod
     def with_cardinality(cls, cardinality, converter, pattern=None,
-                         listsep=','):
+                         listsep=',', capture=False):
         """Creates a type converter for the specified cardinality
         by using the type converter for T.
 
         :param cardinality: Cardinality to use (0..1, 0..*, 1..*).
         :param converter: Type converter (function) for data type T.
         :param pattern:  Regexp pattern for an item (=converter.pattern).
+        :param capture:  Capture items by pattern (if listsep may be in items).
         :return: type-converter for optional<T> (T or None).
         """
         if cardinality is Cardinality.one:
@@ -110,7 +273,8 @@ class TypeBuilder(object):
         if cardinality is Cardinality.zero_or_one:
             return builder_func(converter, pattern)
         # -- MANY CASE: 0..*, 1..*
-        return builder_func(converter, pattern, listsep=listsep)
+        return builder_func(converter, pattern, listsep=listsep,
+                            capture=capture)
 
     @classmethod
     def with_zero_or_one(cls, converter, pattern=None):
@@ -121,74 +285,41 @@ class TypeBuilder(object):
         :param pattern:  Regexp pattern for an item (=converter.pattern).
         :return: type-converter for optional<T> (T or None).
         """
-        cardinality = Cardinality.zero_or_one
         if not pattern:
             pattern = getattr(converter, "pattern", cls.default_pattern)
-        optional_pattern = cardinality.make_pattern(pattern)
-        group_count = cardinality.compute_group_count(pattern)
-
-        def convert_optional(text, m=None):
-            # pylint: disable=invalid-name, unused-argument, missing-docstring
-            if text:
-                text = text.strip()
-            if not text:
-                return None
-            return converter(text)
-        convert_optional.pattern = optional_pattern
-        convert_optional.regex_group_count = group_count
-        return convert_optional
+        return ZeroOrOneTypeConverter(converter, pattern)
 
     @classmethod
-    def with_zero_or_more(cls, converter, pattern=None, listsep=","):
+    def with_zero_or_more(cls, converter, pattern=None, listsep=",",
+                          capture=False):
         """Creates a type converter function for a list<T> with 0..N items
         by using the type converter for one item of T.
 
         :param converter: Type converter (function) for data type T.
         :param pattern:  Regexp pattern for an item (=converter.pattern).
         :param listsep:  Optional list separator between items (default: ',')
+        :param capture:  Capture items by pattern (if listsep may be in items).
         :return: type-converter for list<T>
         """
-        cardinality = Cardinality.zero_or_more
         if not pattern:
             pattern = getattr(converter, "pattern", cls.default_pattern)
-        many0_pattern = cardinality.make_pattern(pattern, listsep)
-        group_count = cardinality.compute_group_count(pattern)
-
-        def convert_list0(text, m=None):
-            # pylint: disable=invalid-name, unused-argument, missing-docstring
-            if text:
-                text = text.strip()
-            if not text:
-                return []
-            return [converter(part.strip()) for part in text.split(listsep)]
-        convert_list0.pattern = many0_pattern
-        # OLD convert_list0.group_count = group_count
-        convert_list0.regex_group_count = group_count
-        return convert_list0
+        return ZeroOrMoreTypeConverter(converter, pattern, listsep, capture)
 
     @classmethod
-    def with_one_or_more(cls, converter, pattern=None, listsep=","):
+    def with_one_or_more(cls, converter, pattern=None, listsep=",",
+                         capture=False):
         """Creates a type converter function for a list<T> with 1..N items
         by using the type converter for one item of T.
 
         :param converter: Type converter (function) for data type T.
         :param pattern:  Regexp pattern for an item (=converter.pattern).
         :param listsep:  Optional list separator between items (default: ',')
+        :param capture:  Capture items by pattern (if listsep may be in items).
         :return: Type converter for list<T>
         """
-        cardinality = Cardinality.one_or_more
         if not pattern:
             pattern = getattr(converter, "pattern", cls.default_pattern)
-        many_pattern = cardinality.make_pattern(pattern, listsep)
-        group_count = cardinality.compute_group_count(pattern)
-
-        def convert_list(text, m=None):
-            # pylint: disable=invalid-name, unused-argument, missing-docstring
-            return [converter(part.strip()) for part in text.split(listsep)]
-        convert_list.pattern = many_pattern
-        # OLD: convert_list.group_count = group_count
-        convert_list.regex_group_count = group_count
-        return convert_list
+        return OneOrMoreTypeConverter(converter, pattern, listsep, capture)
 
     # -- ALIAS METHODS:
     @classmethod
@@ -197,11 +328,11 @@ class TypeBuilder(object):
         return cls.with_zero_or_one(converter, pattern)
 
     @classmethod
-    def with_many(cls, converter, pattern=None, listsep=','):
+    def with_many(cls, converter, pattern=None, listsep=',', capture=False):
         """Alias for :py:meth:`with_one_or_more()` method."""
-        return cls.with_one_or_more(converter, pattern, listsep)
+        return cls.with_one_or_more(converter, pattern, listsep, capture)
 
     @classmethod
-    def with_many0(cls, converter, pattern=None, listsep=','):
+    def with_many0(cls, converter, pattern=None, listsep=',', capture=False):
         """Alias for :py:meth:`with_zero_or_more()` method."""
-        return cls.with_zero_or_more(converter, pattern, listsep)
+        return cls.with_zero_or_more(converter, pattern, listsep, capture)
@@ -9,8 +9,10 @@ A cardinality field is a type suffix for parse format expression, ala:
 """
 
 from __future__ import absolute_import
+from functools import partial
 import six
 from parse_type.cardinality import Cardinality, TypeBuilder
+from parse_type.registry import type_variant_cache, IdentityKey
 
 
 class MissingTypeError(KeyError):   # pylint: disable=missing-docstring
@@ -94,7 +96,10 @@ class CardinalityFieldTypeBuilder(object):
     def create_type_variant(cls, type_name, type_converter):
         r"""Create type variants for types with a cardinality field.
         The new type converters are based on the type converter with
-        cardinality=1.
+        cardinality=1. A type variant is built once per process for each
+        (type builder, type_name, type_converter identity, cardinality, listsep)
+        and is shared afterwards
+        (by using the :data:`parse_type.registry.type_variant_cache`).
 
         .. code-block:: python
 
@@ -128,6 +133,24 @@ class CardinalityFieldTypeBuilder(object):
                 raise MissingTypeError(primary_name)
 
         assert callable(type_converter)
+        # -- CACHE KEY: Type builder class and type name are part of the key
+        #    (a subclass may build other variants; a variant has a name).
+        #    The type converter is compared by identity (not by __eq__()).
+        key = (cls, type_name, IdentityKey(type_converter), cardinality,
+               cls.listsep)
+        make_variant = partial(cls.make_type_variant, type_name,
+                               type_converter, cardinality)
+        return type_variant_cache.get_or_create(key, make_variant)
+
+    @classmethod
+    def make_type_variant(cls, type_name, type_converter, cardinality):
+        """Build the type variant for a type converter (without caching).
+
+        :param type_name:  Type name with cardinality field suffix.
+        :param type_converter:  Type converter for cardinality=1.
+        :param cardinality:  Cardinality of the type variant.
+        :return: Type converter variant.
+        """
         type_variant = TypeBuilder.with_cardinality(cardinality,
                                                     type_converter,
                                                     listsep=cls.listsep)
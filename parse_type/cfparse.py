@@ -47,6 +47,8 @@ class Parser(parse.Parser):
         if missing:
             # pylint: disable=logging-not-lazy
             log.debug("MISSING TYPES: %s" % ",".join(missing.keys()))
+            # -- KEEP: Caller's type dictionary unchanged (may be shared).
+            extra_types = dict(extra_types)
             extra_types.update(missing)
 
         # -- FINALLY: Delegate to base class.
@@ -1,7 +1,7 @@
 # -*- coding: UTF-8 -*-
 # BASED-ON: https://github.com/r1chardj0n3s/parse/parse.py
 # VERSION:  parse 1.20.2
-# Same as original parse modules.
+# Same as original parse modules (with parse_type performance extensions).
 #
 # pylint: disable=line-too-long, invalid-name, too-many-locals, too-many-arguments
 # pylint: disable=redefined-builtin, too-few-public-methods, no-else-return
@@ -14,18 +14,43 @@
 from __future__ import absolute_import
 
 import logging
+import mmap
+import os
+import pickle
 import re
 import sys
+from array import array
+import threading
+import time as systime
+from collections import OrderedDict, namedtuple
+from datetime import date
 from datetime import datetime
 from datetime import time
 from datetime import timedelta
+from datetime import timezone
 from datetime import tzinfo
 from decimal import Decimal
 from functools import partial
 
+from parse_type.registry import type_ref, lookup_type, type_registry, IdentityKey
+
+# -- OPTIONAL: regex module for Parser(..., timeout=...) (imported on first use).
+_regex_module = None
+
+
+def _import_regex(timeout):
+    global _regex_module
+    if _regex_module is None:
+        try:
+            import regex
+        except ImportError:
+            raise ImportError("Parser(..., timeout=%r) requires the regex module" % timeout)
+        _regex_module = regex
+    return _regex_module
+
 
 __version__ = "1.20.2"
-__all__ = ["parse", "search", "findall", "with_pattern"]
+__all__ = ["parse", "search", "findall", "with_pattern", "parser_cache"]
 
 log = logging.getLogger(__name__)
 
@@ -61,6 +86,14 @@ def with_pattern(pattern, regex_group_count=None):
     return decorator
 
 
+# -- COMPATIBILITY: str.isascii() requires Python >= 3.7
+def _isascii_fallback(text):
+    return all(ord(char) < 128 for char in text)
+
+
+_isascii = getattr(str, "isascii", None) or _isascii_fallback
+
+
 class int_convert:
     """Convert a string to an integer.
 
@@ -77,10 +110,43 @@ class int_convert:
 
     CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
 
+    # -- PRECOMPILED: Regex per base to remove all non-digit chars.
+    CLEAN_RE = {
+        2: re.compile("[^01]"),
+        8: re.compile("[^01234567]"),
+        10: re.compile("[^0123456789]"),
+        16: re.compile("[^0123456789abcdef]"),
+    }
+    # -- TABLE: Remove thousands separators of "n" numbers ("1,000", "1.000").
+    SEPARATORS_TABLE = str.maketrans("", "", ",. ")
+
     def __init__(self, base=None):
         self.base = base
 
     def __call__(self, string, match):
+        base = self.base
+        if base is None or base == 10:
+            # -- FAST-PATH: Plain decimal number (optional sign), like: "-123"
+            if self.is_plain_decimal(string):
+                return int(string)
+            if base == 10:
+                digits = string.translate(self.SEPARATORS_TABLE)
+                if self.is_plain_decimal(digits):
+                    return int(digits)
+        elif _isascii(string):
+            # -- FAST-PATH: int() supports the base prefix, like: 0x, 0b, 0o
+            try:
+                return int(string, base)
+            except ValueError:
+                pass
+        return self.convert_slow(string)
+
+    @staticmethod
+    def is_plain_decimal(string):
+        digits = string[1:] if string[:1] in ("-", "+") else string
+        return digits.isdigit() and _isascii(digits)
+
+    def convert_slow(self, string):
         if string[0] == "-":
             sign = -1
             number_start = 1
@@ -106,8 +172,10 @@ class int_convert:
                 elif string[number_start + 1] in "xX":
                     base = 16
 
-        chars = int_convert.CHARS[:base]
-        string = re.sub("[^%s]" % chars, "", string.lower())
+        clean_re = self.CLEAN_RE.get(base)
+        if clean_re is None:
+            clean_re = re.compile("[^%s]" % int_convert.CHARS[:base])
+        string = clean_re.sub("", string.lower())
         return sign * int(string, base)
 
 
@@ -123,19 +191,141 @@ class convert_first:
         return self.converter(string)
 
 
+class convert_with_groups:
+    """Call a type converter with the match and the group number of its field.
+    Used for type converters that use the sub-groups of their pattern
+    (marked with: ``type_converter.use_match_groups = True``).
+    """
+
+    def __init__(self, converter, group):
+        self.converter = converter
+        self.group = group
+
+    def __call__(self, string, match):
+        return self.converter(string, match, self.group)
+
+
+class lazy_convert(object):
+    """Type converter of a parser that was loaded from a snapshot.
+    The type converter is bound by its type name on first use
+    (from the extra types or from the type registry).
+    """
+
+    def __init__(self, type_name, extra_types, group=None):
+        self.type_name = type_name
+        self.extra_types = extra_types
+        self.group = group     # -- USE: convert_with_groups (if not None).
+        self._convert = None
+
+    def bind(self):
+        type_converter = self.extra_types.get(self.type_name)
+        if type_converter is None:
+            type_converter = lookup_type(self.type_name)
+        if self.group is not None:
+            self._convert = convert_with_groups(type_converter, self.group)
+        else:
+            self._convert = convert_first(type_converter)
+        return self._convert
+
+    def __call__(self, string, match):
+        convert = self._convert
+        if convert is None:
+            convert = self.bind()
+        return convert(string, match)
+
+
+class decode_first:
+    """Decode the bytes of a field (and its match) before conversion.
+    Used by a Parser in bytes mode to reuse the text type converters.
+    """
+
+    def __init__(self, converter, encoding):
+        self.converter = converter
+        self.encoding = encoding
+
+    def __call__(self, data, match):
+        if data is not None:
+            data = bytes(data).decode(self.encoding)
+        return self.converter(data, DecodedMatch(match, self.encoding))
+
+
+class DecodedMatch(object):
+    """Provides the text view of a regex match object on bytes."""
+
+    def __init__(self, match, encoding):
+        self.match = match
+        self.encoding = encoding
+
+    def _decode(self, data):
+        if data is None:
+            return None
+        return bytes(data).decode(self.encoding)
+
+    def group(self, *args):
+        if len(args) <= 1:
+            return self._decode(self.match.group(*args))
+        return tuple(self._decode(data) for data in self.match.group(*args))
+
+    def groups(self, default=None):
+        return tuple(
+            default if data is None else self._decode(data)
+            for data in self.match.groups()
+        )
+
+    def groupdict(self, default=None):
+        return {
+            name: default if data is None else self._decode(data)
+            for name, data in self.match.groupdict().items()
+        }
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def span(self, group=0):
+        return self.match.span(group)
+
+    def start(self, group=0):
+        return self.match.start(group)
+
+    def end(self, group=0):
+        return self.match.end(group)
+
+
 def percentage(string, match):
     return float(string[:-1]) / 100.0
 
 
 class FixedTzOffset(tzinfo):
-    """Fixed offset in minutes east from UTC."""
+    """Fixed offset in minutes east from UTC.
+
+    Use :meth:`FixedTzOffset.get()` to get a shared (interned) instance.
+    """
 
+    __slots__ = ("_offset", "_name")
     ZERO = timedelta(0)
+    MAXSIZE = 1024
+    _instances = {}
 
     def __init__(self, offset, name):
         self._offset = timedelta(minutes=offset)
         self._name = name
 
+    @classmethod
+    def get(cls, offset, name):
+        """Return the shared instance for this offset and name.
+        Up to :attr:`MAXSIZE` instances are kept (new instances otherwise).
+        """
+        key = (offset, name)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(offset, name)
+            if len(cls._instances) < cls.MAXSIZE:
+                instance = cls._instances.setdefault(key, instance)
+        return instance
+
+    def __reduce__(self):
+        return (self.__class__, (self._offset // timedelta(minutes=1), self._name))
+
     def __repr__(self):
         return "<%s %s %s>" % (self.__class__.__name__, self._name, self._offset)
 
@@ -149,10 +339,15 @@ class FixedTzOffset(tzinfo):
         return self.ZERO
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, FixedTzOffset):
             return NotImplemented
         return self._name == other._name and self._offset == other._offset
 
+    def __hash__(self):
+        return hash((self._name, self._offset))
+
 
 MONTHS_MAP = {
     "Jan": 1,
@@ -252,25 +447,8 @@ def date_convert(
 
     if tz is not None:
         tz = groups[tz]
-    if tz == "Z":
-        tz = FixedTzOffset(0, "UTC")
-    elif tz:
-        tz = tz.strip()
-        if tz.isupper():
-            # TODO use the awesome python TZ module?
-            pass
-        else:
-            sign = tz[0]
-            if ":" in tz:
-                tzh, tzm = tz[1:].split(":")
-            elif len(tz) == 4:  # 'snnn'
-                tzh, tzm = tz[1], tz[2:4]
-            else:
-                tzh, tzm = tz[1:3], tz[3:5]
-            offset = int(tzm) + int(tzh) * 60
-            if sign == "-":
-                offset = -offset
-            tz = FixedTzOffset(offset, tz)
+    if tz:
+        tz = make_tz(tz)
 
     if time_only:
         d = time(H, M, S, u, tzinfo=tz)
@@ -286,22 +464,51 @@ def date_convert(
     return d
 
 
-def strf_date_convert(x, _, type):
-    is_date = any("%" + x in type for x in "aAwdbBmyYjUW")
-    is_time = any("%" + x in type for x in "HIpMSfz")
+def make_tz(tz):
+    """Convert the timezone text of a date/time into a tzinfo object.
+    Timezone names (like: "EST") are returned as text.
+    """
+    if tz == "Z":
+        return FixedTzOffset.get(0, "UTC")
+    tz = tz.strip()
+    if tz.isupper():
+        # TODO use the awesome python TZ module?
+        return tz
+    sign = tz[0]
+    if ":" in tz:
+        tzh, tzm = tz[1:].split(":")
+    elif len(tz) == 4:  # 'snnn'
+        tzh, tzm = tz[1], tz[2:4]
+    else:
+        tzh, tzm = tz[1:3], tz[3:5]
+    offset = int(tzm) + int(tzh) * 60
+    if sign == "-":
+        offset = -offset
+    return FixedTzOffset.get(offset, tz)
 
-    dt = datetime.strptime(x, type)
-    if "%y" not in type and "%Y" not in type:  # year not specified
-        dt = dt.replace(year=datetime.today().year)
 
-    if is_date and is_time:
-        return dt
-    elif is_date:
-        return dt.date()
-    elif is_time:
-        return dt.time()
-    else:
-        ValueError("Datetime not a date nor a time?")
+# -- COMPATIBILITY: datetime.fromisoformat() requires Python >= 3.7
+_has_fromisoformat = hasattr(datetime, "fromisoformat")
+
+
+def iso_date_convert(string, match, ymd=None, hms=None, tz=None):
+    """Convert an ISO 8601 date/time (type: "ti") into a datetime instance.
+
+    FAST-PATH: Uses :meth:`datetime.fromisoformat()` for the date and time
+    part and falls back to :func:`date_convert()` if it is not supported
+    (like: "1997-07-16  1:20") or not available (Python < 3.7).
+    """
+    if not _has_fromisoformat:
+        return date_convert(string, match, ymd=ymd, hms=hms, tz=tz)
+    tz_text = match.group(tz + 1) if tz is not None else None
+    text = string[: -len(tz_text)] if tz_text else string
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return date_convert(string, match, ymd=ymd, hms=hms, tz=tz)
+    if tz_text:
+        dt = dt.replace(tzinfo=make_tz(tz_text))
+    return dt
 
 
 # ref: https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes
@@ -332,6 +539,180 @@ dt_format_to_regex = {
 dt_format_symbols_re = re.compile("|".join(dt_format_to_regex))
 
 
+def current_year():
+    """Return the current year (cached until the next year starts)."""
+    global _current_year, _current_year_expires
+    now = systime.time()
+    if now >= _current_year_expires:
+        _current_year = datetime.fromtimestamp(now).year
+        _current_year_expires = datetime(_current_year + 1, 1, 1).timestamp()
+    return _current_year
+
+_current_year = None
+_current_year_expires = 0.0
+
+
+class strftime_convert(object):
+    """Compiled type converter for a strftime-style date/time format
+    (like: "%Y-%m-%d %H:%M:%S").
+
+    The regex pattern has one sub-group per directive. The converter takes
+    the integers directly from these sub-groups of the match (instead of
+    re-parsing the text with ``datetime.strptime()`` for each value).
+    Formats with other directives (like: ``%a``, ``%U``) fall back to
+    ``datetime.strptime()``.
+
+    :param format:  Date/time format with strftime directives.
+    :param group_index: Index of the field in the regex groups (zero-based).
+    """
+    DATE_DIRECTIVES = "aAwdbBmyYjUW"
+    TIME_DIRECTIVES = "HIpMSfz"
+    GROUP_PATTERNS = {
+        "%Y": "([0-9]{4})",
+        "%y": "([0-9]{2})",
+        "%m": "([0-9]{1,2})",
+        "%d": "([0-9]{1,2})",
+        "%b": "(%s)" % dt_format_to_regex["%b"],
+        "%B": "(%s)" % dt_format_to_regex["%B"],
+        "%j": "([0-9]{1,3})",
+        "%H": "([0-9]{1,2})",
+        "%I": "([0-9]{1,2})",
+        "%p": "(%s)" % dt_format_to_regex["%p"],
+        "%M": "([0-9]{2})",
+        "%S": "([0-9]{2})",
+        "%f": "([0-9]{1,6})",
+        "%z": "([+-][0-9]{2}(?::?[0-9]{2})?(?::?[0-9]{2})?)",
+    }
+    # -- FIELDS: A directive may only occur once (per datetime field).
+    DIRECTIVE_FIELDS = {
+        "%Y": "year", "%y": "year", "%m": "month", "%b": "month",
+        "%B": "month", "%d": "day", "%j": "day", "%H": "hour", "%I": "hour",
+        "%p": "ampm", "%M": "minute", "%S": "second", "%f": "microsecond",
+        "%z": "tz",
+    }
+
+    def __init__(self, format, group_index=0):
+        self.format = format
+        self.group_index = group_index
+        self.is_date = any("%" + x in format for x in self.DATE_DIRECTIVES)
+        self.is_time = any("%" + x in format for x in self.TIME_DIRECTIVES)
+        self.has_year = "%y" in format or "%Y" in format
+        self.directives = self.compile_directives(format)
+        if self.directives is None:
+            # -- FALLBACK: Use datetime.strptime() for each value.
+            self.pattern = get_regex_for_datetime_format(format)
+            self.groups = ()
+        else:
+            parts = re.split("(%.)", format)
+            self.pattern = "".join(
+                self.GROUP_PATTERNS[part] if index % 2 else re.escape(part)
+                for index, part in enumerate(parts)
+            )
+            # -- GROUPS: Sub-groups follow the field group (at: group_index).
+            first = group_index + 2
+            self.groups = tuple(range(first, first + len(self.directives)))
+        self.regex_group_count = re.compile(self.pattern).groups
+
+    @classmethod
+    def compile_directives(cls, format):
+        """Return the directives of the format (in order) or None,
+        if the format cannot be converted from regex sub-groups.
+        """
+        directives = tuple(re.findall("%.", format))
+        fields = [cls.DIRECTIVE_FIELDS.get(d) for d in directives]
+        if None in fields or len(set(fields)) != len(fields):
+            return None
+        if "day" in fields and "%j" in directives and "month" in fields:
+            return None
+        return directives
+
+    def __reduce__(self):
+        return (self.__class__, (self.format, self.group_index))
+
+    def __call__(self, string, match):
+        if self.directives is None:
+            dt = datetime.strptime(string, self.format)
+            if not self.has_year:
+                dt = dt.replace(year=current_year())
+        else:
+            dt = self.make_datetime(match)
+        if self.is_date and self.is_time:
+            return dt
+        elif self.is_date:
+            return dt.date()
+        elif self.is_time:
+            return dt.time()
+        raise ValueError("Datetime not a date nor a time?")
+
+    def make_datetime(self, match):
+        year = 1900
+        month = day = 1
+        hour = minute = second = microsecond = 0
+        julian = ampm = tz = None
+        for directive, index in zip(self.directives, self.groups):
+            text = match.group(index)
+            if directive == "%Y":
+                year = int(text)
+            elif directive == "%m":
+                month = int(text)
+            elif directive == "%d":
+                day = int(text)
+            elif directive == "%H":
+                hour = int(text)
+            elif directive == "%M":
+                minute = int(text)
+            elif directive == "%S":
+                second = int(text)
+            elif directive == "%f":
+                microsecond = int(text.ljust(6, "0"))
+            elif directive == "%y":
+                year = int(text)
+                year += 1900 if year >= 69 else 2000
+            elif directive == "%b" or directive == "%B":
+                month = MONTHS_MAP[text.capitalize()]
+            elif directive == "%I":
+                hour = int(text)
+                ampm = ampm or ""
+            elif directive == "%p":
+                ampm = text.upper()
+            elif directive == "%j":
+                julian = int(text)
+            elif directive == "%z":
+                tz = self.make_timezone(text)
+
+        if ampm is not None and "%I" in self.directives:
+            # -- SAME AS: datetime.strptime() for "%I" with/without "%p"
+            if not 1 <= hour <= 12:
+                raise ValueError("hour must be in 1..12: %d" % hour)
+            hour %= 12
+            if ampm == "PM":
+                hour += 12
+        if julian is not None:
+            if not 1 <= julian <= 366:
+                raise ValueError("day of year must be in 1..366: %d" % julian)
+            day1 = date(year, 1, 1).toordinal()
+            the_date = date.fromordinal(day1 + julian - 1)
+            year, month, day = the_date.year, the_date.month, the_date.day
+        dt = datetime(year, month, day, hour, minute, second, microsecond, tz)
+        if not self.has_year:
+            dt = dt.replace(year=current_year())
+        return dt
+
+    @staticmethod
+    def make_timezone(text):
+        # -- SHARED: Same tzinfo objects as make_tz() (see: FixedTzOffset.get()).
+        digits = text[1:].replace(":", "")
+        offset = int(digits[:2]) * 60 + int(digits[2:4] or 0)
+        if text[0] == "-":
+            offset = -offset
+        seconds = int(digits[4:6] or 0)
+        if seconds:
+            # -- RARE: Offset with seconds (not supported by FixedTzOffset).
+            offset = timedelta(minutes=abs(offset), seconds=seconds)
+            return timezone(-offset if text[0] == "-" else offset)
+        return FixedTzOffset.get(offset, text)
+
+
 def get_regex_for_datetime_format(format_):
     """
     Generate a regex pattern for a given datetime format string.
@@ -346,6 +727,255 @@ def get_regex_for_datetime_format(format_):
     return dt_format_symbols_re.sub(lambda m: dt_format_to_regex[m.group(0)], format_)
 
 
+def _rebuild_parser(cls, format, extra_types, options):
+    # -- SUBCLASS SUPPORT: Independent of the __init__() signature of cls.
+    # The public attributes of a subclass are restored by pickle (as state).
+    parser = cls.__new__(cls)
+    Parser.__init__(parser, format, extra_types, **options)
+    return parser
+
+
+# -- PARALLEL FINDALL: Helper functions (must be picklable).
+_parallel_parser = None
+
+
+def _init_parallel_worker(parser):
+    global _parallel_parser
+    _parallel_parser = parser
+
+
+def _split_records(data, chunk_size, separator):
+    """Split data into (start, end) ranges of about chunk_size
+    that end at a record separator (or at the end of the data).
+    """
+    size = len(data)
+    start = 0
+    while start < size:
+        end = data.find(separator, min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + len(separator)
+        yield start, end
+        start = end
+
+
+def _findall_chunk(data, offset, spans=True, result_type=None, parser=None):
+    # -- WORKER PROCESS: Uses the parser of its pool initializer.
+    if parser is None:
+        parser = _parallel_parser
+    results = list(parser.findall(data, spans=spans, result_type=result_type))
+    if spans and offset and result_type is None:
+        for result in results:
+            result.spans = {
+                key: (start + offset, end + offset)
+                for key, (start, end) in result.spans.items()
+            }
+    return results
+
+
+def _findall_file_chunk(filename, start, end, encoding, spans=True, result_type=None,
+                        parser=None):
+    if parser is None:
+        parser = _parallel_parser
+    with open(filename, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    if not parser.encoding:
+        data = data.decode(encoding)
+    return _findall_chunk(data, start, spans=spans, result_type=result_type,
+                          parser=parser)
+
+
+def _convert_column(converter, texts, matches, arrays=False):
+    """Convert all texts of a column with the same type converter.
+
+    Converters for the builtin numeric types are applied in bulk
+    (without per-value dispatch); other converters are called per value
+    (with their regex match object).
+    """
+    typecode = None
+    values = None
+    if converter is None:
+        return texts
+    elif isinstance(converter, profiled_convert):
+        # -- STATS: Same fast-path as without stats (classify plain converter).
+        return converter.convert_column(texts, matches, arrays)
+    elif isinstance(converter, convert_first) and converter.converter is float:
+        values = list(map(float, texts))
+        typecode = "d"
+    elif isinstance(converter, int_convert) and converter.base in (None, 10):
+        try:
+            # -- FAST-PATH: Plain decimal numbers (w/o base prefix/separators).
+            # ASCII only: int() accepts other Unicode digits (int_convert not).
+            if all(map(_isascii, texts)):
+                values = list(map(int, texts))
+        except (TypeError, ValueError):
+            values = None
+        typecode = "q"
+    elif isinstance(converter, int_convert):
+        typecode = "q"
+
+    if values is None:
+        values = [converter(text, m) for text, m in zip(texts, matches)]
+    if arrays and typecode:
+        try:
+            return array(typecode, values)
+        except (OverflowError, TypeError):
+            pass
+    return values
+
+
+class TimeoutPattern(object):
+    """Compiled regex pattern (of the regex module) with a time budget
+    for each match operation (raises TimeoutError).
+    """
+
+    def __init__(self, pattern, timeout):
+        self.pattern = pattern
+        self.timeout = timeout
+
+    def match(self, string, pos=None, endpos=None):
+        return self.pattern.match(string, pos, endpos, timeout=self.timeout)
+
+    def search(self, string, pos=None, endpos=None):
+        return self.pattern.search(string, pos, endpos, timeout=self.timeout)
+
+    def __getattr__(self, name):
+        return getattr(self.pattern, name)
+
+
+# -- PROFILING: Opt-in instrumentation (see: Parser.enable_stats()).
+class TimingStats(object):
+    """Counters of a profiled operation: number of calls, cumulated time
+    (in seconds) and number of failures (exceptions or regex mismatches).
+    """
+
+    __slots__ = ("count", "time", "failures")
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.failures = 0
+
+    def as_dict(self):
+        return dict(count=self.count, time=self.time, failures=self.failures)
+
+
+class ParserStats(object):
+    """Profiling counters of a Parser (regex matching, result evaluation,
+    type conversion per field and per converter/type).
+
+    :param callback: Export callback, called with the stats data (or None).
+    :param export_every: Export after each N-th evaluated result (or None).
+    """
+
+    def __init__(self, callback=None, export_every=None):
+        self.callback = callback
+        self.export_every = export_every
+        self.regex = TimingStats()
+        self.evaluate = TimingStats()
+        self.fields = OrderedDict()
+        self.converters = OrderedDict()
+
+    def reset(self):
+        for timing_stats in self._all_timing_stats():
+            timing_stats.__init__()
+
+    def _all_timing_stats(self):
+        yield self.regex
+        yield self.evaluate
+        for timing_stats in self.fields.values():
+            yield timing_stats
+        for timing_stats in self.converters.values():
+            yield timing_stats
+
+    def as_dict(self):
+        """Return a snapshot of the stats data (as dictionary).
+        The time of the regex match operations and result evaluations
+        are provided separately (``regex``, ``evaluate``).
+        """
+        return dict(
+            regex=self.regex.as_dict(),
+            evaluate=self.evaluate.as_dict(),
+            fields=OrderedDict(
+                (field, stats.as_dict()) for field, stats in self.fields.items()
+            ),
+            converters=OrderedDict(
+                (name, stats.as_dict()) for name, stats in self.converters.items()
+            ),
+        )
+
+
+class ProfiledPattern(object):
+    """Compiled regex pattern that records the time of match operations."""
+
+    def __init__(self, pattern, stats):
+        self.pattern = pattern
+        self.stats = stats
+
+    def _profile(self, func, string, pos, endpos):
+        stats = self.stats
+        start = systime.perf_counter()
+        if endpos is None:
+            m = func(string, pos)
+        else:
+            m = func(string, pos, endpos)
+        stats.time += systime.perf_counter() - start
+        stats.count += 1
+        if m is None:
+            stats.failures += 1
+        return m
+
+    def match(self, string, pos=0, endpos=None):
+        return self._profile(self.pattern.match, string, pos, endpos)
+
+    def search(self, string, pos=0, endpos=None):
+        return self._profile(self.pattern.search, string, pos, endpos)
+
+    def __getattr__(self, name):
+        return getattr(self.pattern, name)
+
+
+class profiled_convert(object):
+    """Type converter wrapper that records the conversion time
+    for the field and for the type converter.
+    """
+
+    def __init__(self, converter, field_stats, converter_stats):
+        self.converter = converter
+        self.field_stats = field_stats
+        self.converter_stats = converter_stats
+
+    def __call__(self, string, match):
+        start = systime.perf_counter()
+        try:
+            return self.converter(string, match)
+        except Exception:
+            self.field_stats.failures += 1
+            self.converter_stats.failures += 1
+            raise
+        finally:
+            elapsed = systime.perf_counter() - start
+            self.field_stats.count += 1
+            self.field_stats.time += elapsed
+            self.converter_stats.count += 1
+            self.converter_stats.time += elapsed
+
+    def convert_column(self, texts, matches, arrays=False):
+        # -- COLUMN API: Records one count per value (see: _convert_column()).
+        start = systime.perf_counter()
+        try:
+            return _convert_column(self.converter, texts, matches, arrays)
+        except Exception:
+            self.field_stats.failures += 1
+            self.converter_stats.failures += 1
+            raise
+        finally:
+            elapsed = systime.perf_counter() - start
+            self.field_stats.count += len(texts)
+            self.field_stats.time += elapsed
+            self.converter_stats.count += len(texts)
+            self.converter_stats.time += elapsed
+
+
 class TooManyFields(ValueError):
     pass
 
@@ -417,7 +1047,24 @@ PARSE_RE = re.compile(r"({{|}}|{[\w-]*(?:\.[\w-]+|\[[^]]+])*(?::[^}]+)?})")
 class Parser(object):
     """Encapsulate a format string that may be used to parse other strings."""
 
-    def __init__(self, format, extra_types=None, case_sensitive=False):
+    def __init__(
+        self, format, extra_types=None, case_sensitive=False, encoding=None,
+        delimited=False, atomic=False, timeout=None,
+    ):
+        """Create a parser for a format.
+
+        Regex backtracking can be reduced for untyped fields ({} or {name})
+        by using the following options:
+
+          * delimited: An untyped field that is followed by literal text
+            can not contain the first char of this literal text
+            (compiled as negated char class, like: "[^,]+" for "{},").
+          * atomic: Delimited fields are compiled as possessive quantifiers
+            (REQUIRES: Python >= 3.11; ignored otherwise).
+          * timeout: Time budget (in seconds) for each regex match operation.
+            A TimeoutError is raised if a match takes longer.
+            REQUIRES: regex module (https://pypi.org/project/regex/)
+        """
         # a mapping of a name as in {hello.world} to a regex-group compatible
         # name, like hello__world. It's used to prevent the transformation of
         # name-to-group and group to name to fail subtly, such as in:
@@ -430,7 +1077,22 @@ class Parser(object):
         # field type specification for the named field
         self._name_types = {}
 
+        # -- BYTES MODE: Match bytes-like objects (bytes, bytearray, mmap, ...).
+        # The format is decoded; the regex is compiled from the encoded
+        # expression. Only field texts with a type conversion are decoded.
+        self._encoding = None
+        if isinstance(format, bytes):
+            self._encoding = encoding or "utf-8"
+            format = format.decode(self._encoding)
+        elif encoding:
+            self._encoding = encoding
+
         self._format = format
+        self._delimited = delimited
+        self._atomic = atomic and sys.version_info >= (3, 11)
+        self._timeout = timeout
+        if timeout is not None:
+            _import_regex(timeout)
         if extra_types is None:
             extra_types = {}
         self._extra_types = extra_types
@@ -440,14 +1102,175 @@ class Parser(object):
             self._re_flags = re.IGNORECASE | re.DOTALL
         self._fixed_fields = []
         self._named_fields = []
+        self._field_order = []
         self._group_index = 0
         self._type_conversions = {}
+        self._field_types = {}
+        self._used_types = {}
+        self._stats = None
         self._expression = self._generate_expression()
+        if self._encoding:
+            self._type_conversions = {
+                group: decode_first(converter, self._encoding)
+                for group, converter in self._type_conversions.items()
+            }
         self.__search_re = None
         self.__match_re = None
 
         log.debug("format %r -> %r", format, self._expression)
 
+    def __reduce__(self):
+        # -- PICKLE: By format and the used extra types (not: compiled regex).
+        # The parser is rebuilt when it is unpickled (e.g. in worker processes).
+        # Registered type converters are pickled by name (see: type_registry).
+        used_types = {
+            name: type_ref(converter) for name, converter in self._used_types.items()
+        }
+        # Subclasses are rebuilt without calling their __init__(); their
+        # public attributes are pickled as state (private ones are not).
+        options = self._options()
+        state = {
+            name: value for name, value in self.__dict__.items()
+            if not name.startswith("_") and name != "evaluate_result"
+        }
+        args = (self.__class__, self._format, used_types, options)
+        if state:
+            return (_rebuild_parser, args, state)
+        return (_rebuild_parser, args)
+
+    def _options(self):
+        return dict(
+            case_sensitive=not (self._re_flags & re.IGNORECASE),
+            encoding=self._encoding,
+            delimited=self._delimited,
+            atomic=self._atomic,
+            timeout=self._timeout,
+        )
+
+    # -- SNAPSHOT: Analyzed format state (see: save_snapshot(), load_snapshot()).
+    SNAPSHOT_VERSION = 1
+    _snapshot_attributes = (
+        "_format", "_expression", "_group_to_name_map", "_name_to_group_map",
+        "_name_types", "_fixed_fields", "_named_fields", "_field_order",
+        "_group_index", "_field_types",
+        "_literal_prefix", "_literal_suffix", "_literals", "_ignore_case",
+    )
+
+    def snapshot(self):
+        """Return the analyzed format of this parser as (picklable) state.
+        A parser is created from this state with :meth:`from_snapshot()`
+        without analyzing its format again.
+
+        The type converters of extra types are stored by their type name
+        (and the pattern that was used), the builtin type conversions
+        (like: "d", "ti") are stored as objects.
+        """
+        conversions = self._type_conversions
+        if self._stats is not None:
+            conversions = self._plain_conversions
+        builtin_conversions = {}
+        type_names = {}
+        for group, converter in conversions.items():
+            if isinstance(converter, decode_first):
+                converter = converter.converter
+            type_name = self._field_types.get(group)
+            if type_name in self._used_types:
+                type_names[group] = (type_name, getattr(converter, "group", None))
+            else:
+                builtin_conversions[group] = converter
+
+        state = {name: getattr(self, name) for name in self._snapshot_attributes}
+        state.update(
+            version=self.SNAPSHOT_VERSION,
+            options=self._options(),
+            conversions=builtin_conversions,
+            type_names=type_names,
+            type_patterns={
+                name: _type_pattern(converter)
+                for name, converter in self._used_types.items()
+            },
+        )
+        return state
+
+    @classmethod
+    def from_snapshot(cls, state, extra_types=None):
+        """Create a parser from its snapshot state (see: :meth:`snapshot()`).
+
+        The type converters of extra types are resolved by their type name
+        (from "extra_types" or from the type registry) and are bound lazily.
+        If a type has another pattern than in the snapshot, the parser
+        is created from its format instead (stale snapshot).
+
+        :param state:  Snapshot state of a parser (as dict).
+        :param extra_types:  Type dictionary with type converters (or None).
+        :return: Parser instance.
+        :raises ValueError: If the snapshot version is not supported
+            or if a type of the snapshot is unknown.
+        """
+        if state.get("version") != cls.SNAPSHOT_VERSION:
+            raise ValueError(
+                "Unsupported parser snapshot version: %r" % state.get("version")
+            )
+        if extra_types is None:
+            extra_types = {}
+        options = state["options"]
+        types, is_current = _resolve_snapshot_types(state, extra_types)
+        if not is_current:
+            all_types = dict(extra_types)
+            all_types.update(types)
+            return cls(state["_format"], all_types, **options)
+
+        parser = cls.__new__(cls)
+        parser.__dict__.update((name, state[name]) for name in cls._snapshot_attributes)
+        parser._encoding = options["encoding"]
+        parser._delimited = options["delimited"]
+        parser._atomic = options["atomic"]
+        parser._timeout = options["timeout"]
+        if parser._timeout is not None:
+            _import_regex(parser._timeout)
+        if options["case_sensitive"]:
+            parser._re_flags = re.DOTALL
+        else:
+            parser._re_flags = re.IGNORECASE | re.DOTALL
+        parser._extra_types = extra_types
+        parser._stats = None
+
+        conversions = dict(state["conversions"])
+        used_types = {}
+        for group, (type_name, match_group) in state["type_names"].items():
+            conversions[group] = lazy_convert(type_name, types, match_group)
+            used_types[type_name] = types[type_name]
+        if parser._encoding:
+            conversions = {
+                group: decode_first(converter, parser._encoding)
+                for group, converter in conversions.items()
+            }
+        parser._type_conversions = conversions
+        parser._used_types = used_types
+        parser.__search_re = None
+        parser.__match_re = None
+        return parser
+
+    # -- LAZY: Result plan and prefilter are compiled on first use
+    #    (keeps parser construction cheap, like: parsers that are never used).
+    _result_plan_attributes = frozenset([
+        "_fixed_plan", "_named_plan", "_has_nested_names", "_value_groups",
+        "_value_conversions", "_result_factories", "_namedtuple_class",
+    ])
+    _prefilter_attributes = frozenset([
+        "_literal_prefix", "_literal_suffix", "_literals", "_ignore_case",
+    ])
+
+    def __getattr__(self, name):
+        # -- CALLED-ONLY: If the attribute is missing.
+        if name in Parser._result_plan_attributes and "_type_conversions" in self.__dict__:
+            self._compile_result_plan()
+            return self.__dict__[name]
+        elif name in Parser._prefilter_attributes and "_format_parts" in self.__dict__:
+            self._compile_prefilter()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
     def __repr__(self):
         if len(self._format) > 20:
             return "<%s %r>" % (self.__class__.__name__, self._format[:17] + "...")
@@ -457,7 +1280,7 @@ class Parser(object):
     def _search_re(self):
         if self.__search_re is None:
             try:
-                self.__search_re = re.compile(self._expression, self._re_flags)
+                self.__search_re = self._compile(self._expression)
             except AssertionError:
                 # access error through sys to keep py3k and backward compat
                 e = str(sys.exc_info()[1])
@@ -472,7 +1295,7 @@ class Parser(object):
         if self.__match_re is None:
             expression = r"\A%s\Z" % self._expression
             try:
-                self.__match_re = re.compile(expression, self._re_flags)
+                self.__match_re = self._compile(expression)
             except AssertionError:
                 # access error through sys to keep py3k and backward compat
                 e = str(sys.exc_info()[1])
@@ -487,6 +1310,111 @@ class Parser(object):
                 )
         return self.__match_re
 
+    def _make_pattern(self, expression):
+        if self._encoding:
+            return expression.encode(self._encoding)
+        return expression
+
+    def _compile(self, expression):
+        pattern = self._make_pattern(expression)
+        if self._timeout is not None:
+            regex = _import_regex(self._timeout)
+            pattern = TimeoutPattern(regex.compile(pattern, self._re_flags), self._timeout)
+        else:
+            pattern = re.compile(pattern, self._re_flags)
+        if self._stats is not None:
+            pattern = ProfiledPattern(pattern, self._stats.regex)
+        return pattern
+
+    # -- PROFILING:
+    def enable_stats(self, callback=None, export_every=None):
+        """Enable the (opt-in) profiling of this parser.
+
+        Records the number of calls, cumulated time and failures of:
+
+          * regex: Regex match operations (failure: mismatch)
+          * evaluate: Result evaluations (see: evaluate_result())
+          * fields: Type conversion per field (index or name of the field)
+          * converters: Type conversion per type (like: "d", "ti", "Number")
+
+        :param callback: Export callback for the stats data (see: stats()).
+        :param export_every: Call the export callback automatically after
+            each N-th evaluated result (or None: only by export_stats()).
+        """
+        self.disable_stats()
+        stats = ParserStats(callback, export_every)
+        profiled_conversions = {}
+        for group, converter in self._type_conversions.items():
+            if isinstance(group, str):
+                field = self._group_to_name_map[group]
+            else:
+                field = self._fixed_fields.index(group)
+            type_name = self._field_types.get(group)
+            field_stats = stats.fields.setdefault(field, TimingStats())
+            converter_stats = stats.converters.setdefault(type_name, TimingStats())
+            profiled_conversions[group] = profiled_convert(
+                converter, field_stats, converter_stats
+            )
+        self._plain_conversions = self._type_conversions
+        self._type_conversions = profiled_conversions
+        self._stats = stats
+        self._compile_result_plan(reset_factories=False)
+        self.__search_re = None
+        self.__match_re = None
+        self.evaluate_result = self._evaluate_result_with_stats
+
+    def disable_stats(self):
+        """Disable the profiling of this parser (if enabled)."""
+        if self._stats is None:
+            return
+        self._type_conversions = self._plain_conversions
+        self._stats = None
+        self._compile_result_plan(reset_factories=False)
+        self.__search_re = None
+        self.__match_re = None
+        del self.evaluate_result
+
+    def stats(self, reset=False):
+        """Return the profiling stats data as dictionary (or None if disabled).
+
+        :param reset: If true, reset the stats counters afterwards.
+        """
+        if self._stats is None:
+            return None
+        data = self._stats.as_dict()
+        if reset:
+            self._stats.reset()
+        return data
+
+    def export_stats(self, reset=True):
+        """Call the export callback with the profiling stats data.
+
+        :param reset: If true (default), reset the stats counters afterwards.
+        """
+        if self._stats is None or self._stats.callback is None:
+            return
+        self._stats.callback(self.stats(reset=reset))
+
+    def _evaluate_result_with_stats(self, m, spans=True, result_type=None):
+        evaluate_stats = self._stats.evaluate
+        start = systime.perf_counter()
+        try:
+            return type(self).evaluate_result(self, m, spans, result_type)
+        except Exception:
+            evaluate_stats.failures += 1
+            raise
+        finally:
+            evaluate_stats.time += systime.perf_counter() - start
+            evaluate_stats.count += 1
+            export_every = self._stats.export_every
+            if export_every and evaluate_stats.count % export_every == 0:
+                self.export_stats(reset=False)
+
+    @property
+    def encoding(self):
+        """Encoding used in bytes mode (or None for text mode)."""
+        return self._encoding
+
     @property
     def named_fields(self):
         return self._named_fields[:]
@@ -499,21 +1427,32 @@ class Parser(object):
     def format(self):
         return self._format
 
-    def parse(self, string, evaluate_result=True):
+    def parse(self, string, evaluate_result=True, spans=True, result_type=None):
         """Match my format to the string exactly.
 
+        If ``spans`` is False, the Result provides no match spans
+        (and does not keep a reference to the regex match object).
+
+        Use ``result_type`` to return another result object instead of
+        a Result instance (see: evaluate_result()).
+
         Return a Result or Match instance or None if there's no match.
         """
+        if self._literals and not self._has_literals(string, anchored=True):
+            return None
         m = self._match_re.match(string)
         if m is None:
             return None
 
         if evaluate_result:
-            return self.evaluate_result(m)
+            return self.evaluate_result(m, spans=spans, result_type=result_type)
         else:
             return Match(self, m)
 
-    def search(self, string, pos=0, endpos=None, evaluate_result=True):
+    def search(
+        self, string, pos=0, endpos=None, evaluate_result=True, spans=True,
+        result_type=None,
+    ):
         """Search the string for my format.
 
         Optionally start the search at "pos" character index and limit the
@@ -523,21 +1462,30 @@ class Parser(object):
         If the ``evaluate_result`` argument is set to ``False`` a
         Match instance is returned instead of the actual Result instance.
 
+        If ``spans`` is False, the Result provides no match spans.
+        Use ``result_type`` to return another result object (see: evaluate_result()).
+
         Return either a Result instance or None if there's no match.
         """
+        # -- PREFILTER: Only for a search of the whole string (same as
+        #    search_many()). Search loops with pos/endpos would scan (and copy)
+        #    the whole string per call (like: search loops on large inputs).
         if endpos is None:
+            if pos == 0 and self._literals and not self._has_literals(string):
+                return None
             endpos = len(string)
         m = self._search_re.search(string, pos, endpos)
         if m is None:
             return None
 
         if evaluate_result:
-            return self.evaluate_result(m)
+            return self.evaluate_result(m, spans=spans, result_type=result_type)
         else:
             return Match(self, m)
 
     def findall(
-        self, string, pos=0, endpos=None, extra_types=None, evaluate_result=True
+        self, string, pos=0, endpos=None, extra_types=None, evaluate_result=True,
+        spans=True, result_type=None,
     ):
         """Search "string" for all occurrences of "format".
 
@@ -547,13 +1495,274 @@ class Parser(object):
 
         Returns an iterator that holds Result or Match instances for each format match
         found.
+
+        If ``spans`` is False, each Result provides no match spans.
+        Use ``result_type`` to return other result objects (see: evaluate_result()).
         """
         if endpos is None:
             endpos = len(string)
         return ResultIterator(
-            self, string, pos, endpos, evaluate_result=evaluate_result
+            self, string, pos, endpos, evaluate_result=evaluate_result, spans=spans,
+            result_type=result_type,
+        )
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def findall_stream(
+        self, stream, chunk_size=DEFAULT_CHUNK_SIZE, max_match_size=None,
+        spans=True, result_type=None,
+    ):
+        """Search a stream for all occurrences of "format".
+
+        The stream is either a file object (with a read() method) or an
+        iterable of text chunks. It is consumed chunk by chunk and never
+        loaded completely into memory. Matches that cross chunk boundaries
+        are found, too.
+
+        Each match must be at most ``max_match_size`` characters long
+        (default: chunk_size). Otherwise, the result is undefined.
+
+        Returns an iterator that holds Result instances (or result_type
+        instances) for each format match found. The Result spans are
+        absolute offsets in the stream.
+        """
+        if max_match_size is None:
+            max_match_size = chunk_size
+        if hasattr(stream, "read"):
+            chunks = iter(partial(stream.read, chunk_size), stream.read(0))
+        else:
+            chunks = iter(stream)
+
+        search = self._search_re.search
+        make_result = None
+        if result_type is not None:
+            make_result = self._result_factories.get(result_type)
+            if make_result is None:
+                make_result = self._make_result_factory(result_type)
+
+        buffer = None
+        offset = 0  # -- ABSOLUTE OFFSET: Of buffer[0] in the stream.
+        at_end = False
+        while not at_end:
+            chunk = next(chunks, None)
+            if chunk is None:
+                at_end = True
+                if buffer is None:
+                    return
+            elif buffer is None:
+                buffer = chunk
+            else:
+                buffer += chunk
+
+            pos = 0
+            cut = None
+            safe_end = len(buffer) - max_match_size
+            while True:
+                m = search(buffer, pos)
+                if m is None:
+                    break
+                if not at_end and (m.end() >= len(buffer) or m.start() >= safe_end):
+                    # -- MATCH MAY CHANGE: Needs more data from the stream.
+                    cut = m.start()
+                    break
+                if make_result is not None:
+                    yield make_result(self._evaluate_values(m))
+                else:
+                    result = self.evaluate_result(m, spans=False)
+                    if spans:
+                        result.spans = {
+                            key: (start + offset, end + offset)
+                            for key, (start, end) in self._make_spans(m).items()
+                        }
+                    yield result
+                pos = m.end() if m.end() > m.start() else m.end() + 1
+
+            # -- DISCARD: Text that can no longer be part of a match.
+            keep_from = max(pos, safe_end)
+            if cut is not None:
+                keep_from = min(keep_from, cut)
+            if keep_from > 0:
+                buffer = buffer[keep_from:]
+                offset += keep_from
+
+    DEFAULT_PARALLEL_CHUNK_SIZE = 4 * 1024 * 1024
+
+    def findall_parallel(
+        self, source, workers=None, chunk_size=DEFAULT_PARALLEL_CHUNK_SIZE,
+        separator=None, encoding=None, spans=True, result_type=None,
+    ):
+        """Search a large text (or file) for all occurrences of "format"
+        by using a pool of worker processes.
+
+        The source is split into chunks of about ``chunk_size`` (characters
+        or bytes) at record boundaries (``separator``, default: newline).
+        Each chunk is searched in a worker process and the results are
+        returned in order (as list). Matches must not cross record boundaries.
+
+        The source is either a text/bytes buffer (str, bytes, bytearray, mmap)
+        or a file path (as os.PathLike object, like: pathlib.Path).
+        A file is read by the workers (not by this process) and decoded with
+        ``encoding`` (default: utf-8) unless the parser is in bytes mode.
+
+        Result spans are absolute offsets in the source. Spans are omitted
+        for text-mode parsers on files (because byte and text offsets differ).
+
+        NOTE: With the "spawn" or "forkserver" start method of multiprocessing
+        (default on macOS and Windows), the worker processes import the main
+        module again. A script must therefore call this method only under an
+        ``if __name__ == "__main__":`` guard (otherwise it fails or recurses).
+
+        EXAMPLE:
+            >>> from pathlib import Path
+            >>> from parse_type.parse import Parser
+            >>> def main():
+            ...     parser = Parser("{level:w} {when:ti} {message}")
+            ...     for result in parser.findall_parallel(Path("server.log")):
+            ...         print(result["level"], result["message"])
+            >>> if __name__ == "__main__":
+            ...     main()
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if hasattr(source, "__fspath__"):
+            filename = os.fspath(source)
+            if separator is None:
+                separator = b"\n"
+            if not self._encoding:
+                spans = False
+            with open(filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return []
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    ranges = list(_split_records(data, chunk_size, separator))
+                finally:
+                    data.close()
+            tasks = [
+                (_findall_file_chunk, (filename, start, end, encoding or "utf-8"))
+                for start, end in ranges
+            ]
+        else:
+            if separator is None:
+                separator = "\n" if isinstance(source, str) else b"\n"
+            tasks = [
+                (_findall_chunk, (source[start:end], start))
+                for start, end in _split_records(source, chunk_size, separator)
+            ]
+
+        if workers <= 1 or len(tasks) <= 1:
+            # -- IN-PROCESS: Pass this parser (module global is for workers only).
+            chunk_results = [func(*args, spans=spans, result_type=result_type,
+                                  parser=self)
+                             for func, args in tasks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_parallel_worker,
+                initargs=(self,),
+            ) as executor:
+                futures = [
+                    executor.submit(func, *args, spans=spans, result_type=result_type)
+                    for func, args in tasks
+                ]
+                chunk_results = [future.result() for future in futures]
+        return [result for results in chunk_results for result in results]
+
+    # -- BATCH API: Process many strings with the same parser.
+    def parse_many(self, strings, evaluate_result=True, spans=True, result_type=None):
+        """Match my format exactly to each string of an iterable.
+
+        Returns an iterator that yields one Result, Match or result_type
+        instance per string (or None if the string does not match).
+        """
+        return self._evaluate_many(
+            self._make_matcher(anchored=True), strings, evaluate_result, spans,
+            result_type,
         )
 
+    def search_many(self, strings, evaluate_result=True, spans=True, result_type=None):
+        """Search each string of an iterable for my format.
+
+        Returns an iterator that yields one Result, Match or result_type
+        instance per string (or None if the format is not found).
+        """
+        return self._evaluate_many(
+            self._make_matcher(), strings, evaluate_result, spans, result_type
+        )
+
+    def parse_columns(self, strings, arrays=False):
+        """Match my format exactly to each string of an iterable and
+        return the field values in column-oriented form.
+
+        Returns a dict that maps each field key (index of a fixed field or
+        name of a named field) to the list of its converted values.
+        Strings that do not match are skipped.
+
+        If ``arrays`` is True, columns of the numeric types (d, n, b, o, x,
+        f, e, g) are returned as array.array (if possible).
+        """
+        return self._make_columns(self._make_matcher(anchored=True), strings, arrays)
+
+    def search_columns(self, strings, arrays=False):
+        """Search each string of an iterable for my format and
+        return the field values in column-oriented form
+        (see: parse_columns()).
+        """
+        return self._make_columns(self._make_matcher(), strings, arrays)
+
+    def _make_matcher(self, anchored=False):
+        # Returns the regex matcher function with the literal prefilter.
+        if anchored:
+            match = self._match_re.match
+        else:
+            match = self._search_re.search
+        if not self._literals:
+            return match
+        has_literals = self._has_literals
+
+        def prefiltered_match(string):
+            if not has_literals(string, anchored):
+                return None
+            return match(string)
+        return prefiltered_match
+
+    def _evaluate_many(self, matcher, strings, evaluate_result, spans, result_type):
+        # -- HOIST: Attribute lookups and result dispatch out of the loop.
+        if not evaluate_result:
+            for string in strings:
+                m = matcher(string)
+                yield None if m is None else Match(self, m)
+        elif result_type is not None:
+            make_result = self._result_factories.get(result_type)
+            if make_result is None:
+                make_result = self._make_result_factory(result_type)
+            evaluate_values = self._evaluate_values
+            for string in strings:
+                m = matcher(string)
+                yield None if m is None else make_result(evaluate_values(m))
+        else:
+            evaluate = self.evaluate_result
+            for string in strings:
+                m = matcher(string)
+                yield None if m is None else evaluate(m, spans)
+
+    def _make_columns(self, matcher, strings, arrays=False):
+        matches = [m for m in map(matcher, strings) if m is not None]
+        columns = {}
+        fixed_index = 0
+        for field, group in zip(self._field_order, self._value_groups):
+            if isinstance(field, str):
+                key = self._group_to_name_map[field]
+            else:
+                key = fixed_index
+                fixed_index += 1
+            texts = [m.group(group) for m in matches]
+            converter = self._type_conversions.get(field)
+            columns[key] = _convert_column(converter, texts, matches, arrays)
+        return columns
+
     def _expand_named_fields(self, named_fields):
         result = {}
         for field, value in named_fields.items():
@@ -578,35 +1787,219 @@ class Parser(object):
 
         return result
 
-    def evaluate_result(self, m):
-        """Generate a Result instance for the given regex match object"""
+    @staticmethod
+    def _split_field_name(field):
+        # split 'aaa[bbb][ccc]...' into the key path ('aaa', 'bbb', 'ccc')
+        n = field.find("[")
+        if n == -1:
+            return None
+        subkeys = re.findall(r"\[[^]]+]", field[n:])
+        return (field[:n],) + tuple(subkey[1:-1] for subkey in subkeys)
+
+    def _compile_prefilter(self):
+        # Extract the literal text segments of the format (from the format
+        # parts of _generate_expression()). A string that does not contain
+        # all literals can not match (checked without regex).
+        #   _literal_prefix: Literal at the start of the format (or "").
+        #   _literal_suffix: Literal at the end of the format (or "").
+        # In case-insensitive mode, only ASCII literals are used
+        # (to be consistent with the re.IGNORECASE semantics).
+        segments = [""]
+        for part in self._format_parts:
+            if part == "{{":
+                segments[-1] += "{"
+            elif part == "}}":
+                segments[-1] += "}"
+            elif part[0] == "{" and part[-1] == "}":
+                segments.append(None)   # -- FIELD
+                segments.append("")
+            else:
+                segments[-1] += part
+
+        self._ignore_case = bool(self._re_flags & re.IGNORECASE)
+        if self._ignore_case:
+            segments = [
+                segment.lower() if segment and _isascii(segment) else ""
+                for segment in segments
+            ]
+        self._literal_prefix = segments[0] or ""
+        self._literal_suffix = segments[-1] or ""
+        self._literals = tuple(segment for segment in segments if segment)
+        if self._encoding:
+            self._literals = ()    # -- BYTES MODE: No prefilter.
+
+    def _has_literals(self, string, anchored=False):
+        # Prefilter: Checks if string contains all literals of the format.
+        if type(string) is not str:
+            return True
+        if self._ignore_case:
+            if not _isascii(string):
+                return True
+            string = string.lower()
+        if anchored and not (string.startswith(self._literal_prefix) and
+                             string.endswith(self._literal_suffix)):
+            return False
+        for literal in self._literals:
+            if literal not in string:
+                return False
+        return True
+
+    def _compile_result_plan(self, reset_factories=True):
+        # Precompute what evaluate_result() needs to do for each field, so a
+        # match only executes this flat plan:
+        #   fixed field: (group_index, converter)
+        #   named field: (group_name, field_name, key_path, converter)
+        # where converter and key_path (for nested names) may be None.
+        conv = self._type_conversions
+        self._fixed_plan = tuple((n, conv.get(n)) for n in self._fixed_fields)
+        self._named_plan = tuple(
+            (
+                group,
+                self._group_to_name_map[group],
+                self._split_field_name(self._group_to_name_map[group]),
+                conv.get(group),
+            )
+            for group in self._named_fields
+        )
+        self._has_nested_names = any(path for _, _, path, _ in self._named_plan)
+
+        # -- RESULT-TYPE PLAN: All fields in format order (see: result_type).
+        #   value_groups: regex group (number or name) per field
+        #   value_conversions: (position, converter) per converted field
+        self._value_groups = tuple(
+            field if isinstance(field, str) else field + 1
+            for field in self._field_order
+        )
+        self._value_conversions = tuple(
+            (i, conv[field]) for i, field in enumerate(self._field_order)
+            if field in conv
+        )
+        # -- KEEP: Result factories do not depend on the type conversions
+        #    (reused when only the conversions change, like: enable_stats()).
+        if reset_factories or "_result_factories" not in self.__dict__:
+            self._result_factories = {}
+            self._namedtuple_class = None
+
+    def evaluate_result(self, m, spans=True, result_type=None):
+        """Generate a Result instance for the given regex match object.
+
+        The match spans are computed lazily (on first access of Result.spans).
+        If ``spans`` is False, the Result has no spans (spans=None).
+
+        If ``result_type`` is provided, the converted field values are
+        returned without building a Result instance:
+
+          * tuple:  Plain tuple of all field values (in format order).
+          * "namedtuple": Instance of the parser-generated namedtuple class
+            (see: namedtuple_class()).
+          * class:  Other class (or callable), like a dataclass, that is
+            called with the fixed field values as positional arguments and
+            the named field values as keyword arguments.
+        """
+        if result_type is not None:
+            make_result = self._result_factories.get(result_type)
+            if make_result is None:
+                make_result = self._make_result_factory(result_type)
+            return make_result(self._evaluate_values(m))
+
         # ok, figure the fixed fields we've pulled out and type convert them
-        fixed_fields = list(m.groups())
-        for n in self._fixed_fields:
-            if n in self._type_conversions:
-                fixed_fields[n] = self._type_conversions[n](fixed_fields[n], m)
-        fixed_fields = tuple(fixed_fields[n] for n in self._fixed_fields)
+        if self._fixed_plan:
+            groups = m.groups()
+            fixed_fields = tuple(
+                groups[n] if converter is None else converter(groups[n], m)
+                for n, converter in self._fixed_plan
+            )
+        else:
+            fixed_fields = ()
 
         # grab the named fields, converting where requested
-        groupdict = m.groupdict()
         named_fields = {}
-        name_map = {}
-        for k in self._named_fields:
-            korig = self._group_to_name_map[k]
-            name_map[korig] = k
-            if k in self._type_conversions:
-                value = self._type_conversions[k](groupdict[k], m)
+        if self._named_plan:
+            groupdict = m.groupdict()
+            if self._has_nested_names:
+                for group, name, path, converter in self._named_plan:
+                    value = groupdict[group]
+                    if converter is not None:
+                        value = converter(value, m)
+                    if path is None:
+                        named_fields[name] = value
+                        continue
+                    # create nested dictionaries {'aaa': {'bbb': {'ccc': ...}}}
+                    d = named_fields
+                    for key in path[:-1]:
+                        d = d.setdefault(key, {})
+                    d[path[-1]] = value
             else:
-                value = groupdict[k]
+                for group, name, path, converter in self._named_plan:
+                    value = groupdict[group]
+                    if converter is not None:
+                        value = converter(value, m)
+                    named_fields[name] = value
+
+        # and that's our result (match spans are computed on demand)
+        result = Result(fixed_fields, named_fields, None)
+        if spans:
+            result._parser = self
+            result._match = m
+        return result
 
-            named_fields[korig] = value
+    def _evaluate_values(self, m):
+        # Returns the converted field values (in format order) as list.
+        groups = self._value_groups
+        if not groups:
+            return []
+        elif len(groups) == 1:
+            values = [m.group(groups[0])]
+        else:
+            values = list(m.group(*groups))
+        for i, converter in self._value_conversions:
+            values[i] = converter(values[i], m)
+        return values
+
+    def namedtuple_class(self):
+        """Return the namedtuple class for results with result_type="namedtuple".
+
+        Named fields use their field name. Other fields (fixed fields or
+        field names that are no valid identifiers) are renamed to "_<index>".
+        """
+        if self._namedtuple_class is None:
+            names = [
+                self._group_to_name_map[group] if isinstance(group, str) else ""
+                for group in self._value_groups
+            ]
+            self._namedtuple_class = namedtuple("ParseResult", names, rename=True)
+        return self._namedtuple_class
+
+    def _make_result_factory(self, result_type):
+        if result_type is tuple:
+            make_result = tuple
+        elif result_type == "namedtuple":
+            make_result = self.namedtuple_class()._make
+        elif callable(result_type):
+            fixed_positions = tuple(
+                i for i, group in enumerate(self._value_groups)
+                if not isinstance(group, str)
+            )
+            named_positions = tuple(
+                (self._group_to_name_map[group], i)
+                for i, group in enumerate(self._value_groups)
+                if isinstance(group, str)
+            )
 
-        # now figure the match spans
-        spans = {n: m.span(name_map[n]) for n in named_fields}
-        spans.update((i, m.span(n + 1)) for i, n in enumerate(self._fixed_fields))
+            def make_result(values):
+                args = [values[i] for i in fixed_positions]
+                kwargs = {name: values[i] for name, i in named_positions}
+                return result_type(*args, **kwargs)
+        else:
+            raise ValueError("result_type=%r not supported" % (result_type,))
+        self._result_factories[result_type] = make_result
+        return make_result
 
-        # and that's our result
-        return Result(fixed_fields, self._expand_named_fields(named_fields), spans)
+    def _make_spans(self, m):
+        # figure the match spans
+        spans = {name: m.span(group) for group, name, _, _ in self._named_plan}
+        spans.update((i, m.span(n + 1)) for i, (n, _) in enumerate(self._fixed_plan))
+        return spans
 
     def _regex_replace(self, match):
         return "\\" + match.group(1)
@@ -614,21 +2007,39 @@ class Parser(object):
     def _generate_expression(self):
         # turn my _format attribute into the _expression attribute
         e = []
-        for part in PARSE_RE.split(self._format):
-            if not part:
-                continue
-            elif part == "{{":
+        parts = [part for part in PARSE_RE.split(self._format) if part]
+        # -- KEEP: Format parts for the prefilter (see: _compile_prefilter()).
+        self._format_parts = parts
+        for i, part in enumerate(parts):
+            if part == "{{":
                 e.append(r"\{")
             elif part == "}}":
                 e.append(r"\}")
             elif part[0] == "{" and part[-1] == "}":
                 # this will be a braces-delimited field to handle
-                e.append(self._handle_field(part))
+                expression = self._handle_field(part)
+                if self._delimited and ":" not in part and i + 1 < len(parts):
+                    expression = self._make_delimited_field(expression, parts[i + 1])
+                e.append(expression)
             else:
                 # just some text to match
                 e.append(REGEX_SAFETY.sub(self._regex_replace, part))
         return "".join(e)
 
+    def _make_delimited_field(self, expression, next_part):
+        # OPTIMIZE: Untyped field followed by literal text (the delimiter).
+        #   "{},"  => "([^,]+)" instead of "(.+?)" (avoids backtracking).
+        if not expression.endswith(".+?)"):
+            return expression   # -- REPEATED NAME: Backreference.
+        if next_part in ("{{", "}}"):
+            delimiter = next_part[0]
+        elif next_part[0] == "{":
+            return expression   # -- FIELD: No delimiter.
+        else:
+            delimiter = next_part[0]
+        quantifier = "++" if self._atomic else "+"
+        return "%s[^%s]%s)" % (expression[:-4], re.escape(delimiter), quantifier)
+
     def _to_group_name(self, field):
         # return a version of field which can be used as capture group, even
         # though it might contain '.'
@@ -684,10 +2095,12 @@ class Parser(object):
                 group = self._to_group_name(name)
                 self._name_types[name] = format
             self._named_fields.append(group)
+            self._field_order.append(group)
             # this will become a group, which must not contain dots
             wrap = r"(?P<%s>%%s)" % group
         else:
             self._fixed_fields.append(self._group_index)
+            self._field_order.append(self._group_index)
             wrap = r"(%s)"
             group = self._group_index
 
@@ -701,16 +2114,21 @@ class Parser(object):
 
         # figure type conversions, if any
         type = format["type"]
+        self._field_types[group] = type
         is_numeric = type and type in "n%fegdobx"
         conv = self._type_conversions
         if type in self._extra_types:
             type_converter = self._extra_types[type]
+            self._used_types[type] = type_converter
             s = getattr(type_converter, "pattern", r".+?")
             regex_group_count = getattr(type_converter, "regex_group_count", 0)
             if regex_group_count is None:
                 regex_group_count = 0
+            if getattr(type_converter, "use_match_groups", False):
+                conv[group] = convert_with_groups(type_converter, self._group_index + 1)
+            else:
+                conv[group] = convert_first(type_converter)
             self._group_index += regex_group_count
-            conv[group] = convert_first(type_converter)
         elif type == "n":
             s = r"\d{1,3}([,.]\d{3})*"
             self._group_index += 1
@@ -755,12 +2173,14 @@ class Parser(object):
             conv[group] = int_convert()
             # do not specify number base, determine it automatically
         elif any(k in type for k in dt_format_to_regex):
-            s = get_regex_for_datetime_format(type)
-            conv[group] = partial(strf_date_convert, type=type)
+            converter = strftime_convert(type, self._group_index)
+            s = converter.pattern
+            conv[group] = converter
+            self._group_index += converter.regex_group_count
         elif type == "ti":
             s = r"(\d{4}-\d\d-\d\d)((\s+|T)%s)?(Z|\s*[-+]\d\d:?\d\d)?" % TIME_PAT
             n = self._group_index
-            conv[group] = partial(date_convert, ymd=n + 1, hms=n + 4, tz=n + 7)
+            conv[group] = partial(iso_date_convert, ymd=n + 1, hms=n + 4, tz=n + 7)
             self._group_index += 7
         elif type == "tg":
             s = r"(\d{1,2}[-/](\d{1,2}|%s)[-/]\d{4})(\s+%s)?%s?%s?"
@@ -877,12 +2297,38 @@ class Result(object):
     Named results may be looked up using `result['name']`.
 
     Named results may be tested for existence using `'name' in result`.
+
+    Match spans are computed lazily from the regex match object
+    (on first access of `result.spans`).
     """
 
+    __slots__ = ("fixed", "named", "_spans", "_parser", "_match")
+
     def __init__(self, fixed, named, spans):
         self.fixed = fixed
         self.named = named
-        self.spans = spans
+        self._spans = spans
+        self._parser = None
+        self._match = None
+
+    @property
+    def spans(self):
+        # -- THREAD-SAFE: Use local references (another thread may clear them).
+        # The spans are stored before the references are cleared.
+        parser, match = self._parser, self._match
+        if parser is not None and match is not None:
+            self._spans = parser._make_spans(match)
+            self._parser = self._match = None
+        return self._spans
+
+    @spans.setter
+    def spans(self, value):
+        self._spans = value
+        self._parser = self._match = None
+
+    def __reduce__(self):
+        # -- REGEX MATCH OBJECTS: Can not be pickled (use spans instead).
+        return (self.__class__, (self.fixed, self.named, self.spans))
 
     def __getitem__(self, item):
         if isinstance(item, (int, slice)):
@@ -918,12 +2364,17 @@ class ResultIterator(object):
     Each element is a Result instance.
     """
 
-    def __init__(self, parser, string, pos, endpos, evaluate_result=True):
+    def __init__(
+        self, parser, string, pos, endpos, evaluate_result=True, spans=True,
+        result_type=None,
+    ):
         self.parser = parser
         self.string = string
         self.pos = pos
         self.endpos = endpos
         self.evaluate_result = evaluate_result
+        self.spans = spans
+        self.result_type = result_type
 
     def __iter__(self):
         return self
@@ -935,7 +2386,9 @@ class ResultIterator(object):
         self.pos = m.end()
 
         if self.evaluate_result:
-            return self.parser.evaluate_result(m)
+            return self.parser.evaluate_result(
+                m, spans=self.spans, result_type=self.result_type
+            )
         else:
             return Match(self.parser, m)
 
@@ -943,7 +2396,412 @@ class ResultIterator(object):
     next = __next__
 
 
-def parse(format, string, extra_types=None, evaluate_result=True, case_sensitive=False):
+# -----------------------------------------------------------------------------
+# PARSER SET: Dispatch to one of many formats with one combined regex
+# -----------------------------------------------------------------------------
+ParserSetMatch = namedtuple("ParserSetMatch", ["key", "parser", "result"])
+
+# -- REGEX TOKENS: Escaped char, named group, named group backreference.
+_GROUP_NAME_RE = re.compile(r"\\.|\(\?P<(\w+)>|\(\?P=(\w+)\)", re.DOTALL)
+
+
+def _prefix_group_names(expression, prefix):
+    """Make the group names of a regex expression unique by using a prefix."""
+
+    def replace(m):
+        if m.group(1):
+            return "(?P<%s%s>" % (prefix, m.group(1))
+        elif m.group(2):
+            return "(?P=%s%s)" % (prefix, m.group(2))
+        return m.group(0)
+
+    return _GROUP_NAME_RE.sub(replace, expression)
+
+
+class SubMatch(object):
+    """Provides the view of one format (alternative) of a ParserSet regex match
+    (same group numbers and group names as the match of its own Parser).
+    """
+
+    def __init__(self, match, group_offset, group_count, prefix, group_names):
+        self.match = match
+        self.group_offset = group_offset
+        self.group_count = group_count
+        self.prefix = prefix
+        self.group_names = group_names
+
+    def _group(self, group):
+        if isinstance(group, int):
+            return self.group_offset + group
+        return self.prefix + group
+
+    def group(self, *args):
+        if not args:
+            return self.match.group(self.group_offset)
+        return self.match.group(*[self._group(group) for group in args])
+
+    def groups(self, default=None):
+        first = self.group_offset
+        return self.match.groups(default)[first:first + self.group_count]
+
+    def groupdict(self, default=None):
+        group = self.match.group
+        prefix = self.prefix
+        result = {}
+        for name in self.group_names:
+            data = group(prefix + name)
+            result[name] = default if data is None else data
+        return result
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def span(self, group=0):
+        return self.match.span(self._group(group))
+
+    def start(self, group=0):
+        return self.match.start(self._group(group))
+
+    def end(self, group=0):
+        return self.match.end(self._group(group))
+
+
+class ParserSet(object):
+    """Matches a string against many formats at once.
+
+    All formats are compiled into one regex (as alternatives), so only one
+    regex match is needed to find the matching format (instead of trying
+    each format in sequence). The matching format is then evaluated
+    by its own Parser from the groups of this match (see: SubMatch).
+
+    The formats are provided as list (key: index) or as dict (key: dict key)
+    of format strings or Parser objects. If several formats match,
+    the first one wins (same as trying the formats in sequence).
+
+    If parsers with a ``timeout`` are used, the combined regex uses
+    the smallest timeout of these parsers (REQUIRES: regex module).
+    """
+
+    def __init__(self, formats, extra_types=None, case_sensitive=False):
+        if isinstance(formats, dict):
+            items = list(formats.items())
+        else:
+            items = list(enumerate(formats))
+        self._keys = []
+        self._parsers = []
+        for key, format in items:
+            parser = format
+            if not isinstance(parser, Parser):
+                parser = Parser(format, extra_types, case_sensitive=case_sensitive)
+            self._keys.append(key)
+            self._parsers.append(parser)
+        if len(set(bool(p.encoding) for p in self._parsers)) > 1:
+            raise ValueError("ParserSet: Can not mix text and bytes formats")
+
+        # -- COMBINED REGEX: One outer group per format (with a group offset).
+        alternatives = []
+        self._group_to_index = {}
+        self._sub_groups = []
+        group_offset = 1
+        for index, parser in enumerate(self._parsers):
+            prefix = "_%d_" % index
+            expression = _prefix_group_names(parser._expression, prefix)
+            if parser._re_flags & re.IGNORECASE:
+                expression = "(?i:%s)" % expression
+            alternatives.append("(%s)" % expression)
+            self._group_to_index[group_offset] = index
+            regex = parser._search_re
+            group_names = tuple(sorted(regex.groupindex, key=regex.groupindex.get))
+            self._sub_groups.append((group_offset, regex.groups, prefix, group_names))
+            group_count = regex.groups
+            group_offset += 1 + group_count
+        self._expression = "|".join(alternatives)
+        # -- TIMEOUT: Smallest time budget of the parsers (if any).
+        timeouts = [p._timeout for p in self._parsers if p._timeout is not None]
+        self._timeout = min(timeouts) if timeouts else None
+        self.__search_re = None
+        self.__match_re = None
+
+    def _compile(self, expression):
+        if self._parsers and self._parsers[0].encoding:
+            expression = expression.encode(self._parsers[0].encoding)
+        if self._timeout is not None:
+            regex = _import_regex(self._timeout)
+            return TimeoutPattern(regex.compile(expression, re.DOTALL), self._timeout)
+        return re.compile(expression, re.DOTALL)
+
+    @property
+    def _search_re(self):
+        if self.__search_re is None:
+            self.__search_re = self._compile(self._expression)
+        return self.__search_re
+
+    @property
+    def _match_re(self):
+        if self.__match_re is None:
+            self.__match_re = self._compile(r"\A(?:%s)\Z" % self._expression)
+        return self.__match_re
+
+    @property
+    def parsers(self):
+        return list(self._parsers)
+
+    def __len__(self):
+        return len(self._parsers)
+
+    def _select(self, m, evaluate_result=True):
+        # -- NO RE-MATCH: The parser evaluates the groups of its alternative.
+        index = self._group_to_index[m.lastindex]
+        parser = self._parsers[index]
+        m = SubMatch(m, *self._sub_groups[index])
+        if evaluate_result:
+            result = parser.evaluate_result(m)
+        else:
+            result = Match(parser, m)
+        return ParserSetMatch(self._keys[index], parser, result)
+
+    def parse(self, string, evaluate_result=True):
+        """Match the string exactly against all formats.
+
+        Return a ParserSetMatch (key, parser, result) for the first
+        matching format or None if no format matches.
+        """
+        m = self._match_re.match(string)
+        if m is None:
+            return None
+        return self._select(m, evaluate_result)
+
+    def search(self, string, pos=0, endpos=None, evaluate_result=True):
+        """Search the string for the first (leftmost) occurrence of any format.
+
+        Return a ParserSetMatch (key, parser, result) or None.
+        """
+        if endpos is None:
+            endpos = len(string)
+        m = self._search_re.search(string, pos, endpos)
+        if m is None:
+            return None
+        return self._select(m, evaluate_result)
+
+
+# -----------------------------------------------------------------------------
+# PARSER CACHE: Shared compiled parsers for parse(), search(), findall()
+# -----------------------------------------------------------------------------
+ParserCacheInfo = namedtuple(
+    "ParserCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class ParserCache(object):
+    """Bounded, thread-safe LRU cache of compiled Parser objects.
+
+    Used by the module-level functions parse(), search() and findall()
+    to avoid re-generating and re-compiling the regular expression
+    for a format on every call.
+
+    The cache key is (format, case_sensitive, extra_types fingerprint).
+    The fingerprint is built from the names and the identity of the
+    type converters in "extra_types" (the key keeps the type converters alive).
+    Therefore, a changed type dictionary causes a cache miss (and never
+    returns a stale parser). A cached parser uses a copy of "extra_types".
+
+    A maxsize of 0 disables caching.
+    """
+
+    DEFAULT_MAXSIZE = 256
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, parser_class=None):
+        self._lock = threading.Lock()
+        self._parsers = OrderedDict()
+        self._maxsize = maxsize
+        self.parser_class = parser_class or Parser
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def __len__(self):
+        return len(self._parsers)
+
+    @staticmethod
+    def make_key(format, extra_types=None, case_sensitive=False):
+        # -- IDENTITY KEYS: Keep the type converters alive (no id() reuse).
+        if extra_types:
+            fingerprint = tuple(
+                sorted(
+                    ((name, IdentityKey(converter))
+                     for name, converter in extra_types.items()),
+                    key=lambda item: item[0],
+                )
+            )
+        else:
+            fingerprint = ()
+        return (format, bool(case_sensitive), fingerprint)
+
+    def get(self, format, extra_types=None, case_sensitive=False):
+        """Return a (shared) Parser for this format.
+
+        The parser is created (and stored in the cache) on a cache miss.
+        """
+        if self._maxsize <= 0:
+            with self._lock:
+                self.misses += 1
+            return self.parser_class(
+                format, extra_types=extra_types, case_sensitive=case_sensitive
+            )
+
+        key = self.make_key(format, extra_types, case_sensitive)
+        with self._lock:
+            parser = self._parsers.get(key)
+            if parser is not None:
+                self._parsers.move_to_end(key)
+                self.hits += 1
+                return parser
+            self.misses += 1
+
+        # -- CACHE MISS: Build parser outside of the lock (may raise errors).
+        # The parser uses a copy of the (mutable) caller's type dictionary.
+        if extra_types:
+            extra_types = dict(extra_types)
+        parser = self.parser_class(
+            format, extra_types=extra_types, case_sensitive=case_sensitive
+        )
+        with self._lock:
+            # -- RACE-CONDITION: Another thread may have stored it already.
+            parser = self._parsers.setdefault(key, parser)
+            self._parsers.move_to_end(key)
+            self._evict(self._maxsize)
+        return parser
+
+    def _evict(self, maxsize):
+        # -- REQUIRES: Lock is held by caller.
+        while len(self._parsers) > maxsize:
+            self._parsers.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """Change the maximum number of cached parsers.
+        Least recently used parsers are evicted if the cache shrinks.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize=%r (expected: maxsize >= 0)" % maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict(maxsize)
+
+    def clear(self):
+        """Remove all cached parsers and reset the statistics counters."""
+        with self._lock:
+            self._parsers.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Return cache statistics (as ParserCacheInfo tuple)."""
+        with self._lock:
+            return ParserCacheInfo(
+                self.hits, self.misses, self.evictions,
+                self._maxsize, len(self._parsers)
+            )
+
+
+parser_cache = ParserCache()
+
+
+# -----------------------------------------------------------------------------
+# PARSER SNAPSHOT: Skip the format analysis of many parsers on startup
+# -----------------------------------------------------------------------------
+def _type_pattern(type_converter):
+    # -- SAME AS: Parser._handle_field() uses the type converter.
+    return (
+        getattr(type_converter, "pattern", r".+?"),
+        getattr(type_converter, "regex_group_count", 0) or 0,
+        bool(getattr(type_converter, "use_match_groups", False)),
+    )
+
+
+def _resolve_snapshot_types(state, extra_types):
+    """Resolve the type converters of the extra types in a snapshot
+    (from "extra_types" or from the type registry).
+
+    :return: Tuple (types, is_current) with the type dictionary and
+        False if the snapshot is stale (changed type pattern or
+        builtin type is now an extra type).
+    :raises ValueError: If an extra type of the snapshot is unknown.
+    """
+    type_patterns = state["type_patterns"]
+    types = {}
+    is_current = True
+    for type_name in set(state["_field_types"].values()):
+        type_converter = extra_types.get(type_name)
+        if type_converter is None and type_name in type_patterns:
+            if type_name not in type_registry:
+                raise ValueError("Unknown type in parser snapshot: %r" % type_name)
+            type_converter = lookup_type(type_name)
+        if type_converter is None:
+            continue    # -- BUILTIN TYPE: Like "d", "ti", ...
+        types[type_name] = type_converter
+        if _type_pattern(type_converter) != type_patterns.get(type_name):
+            is_current = False
+    return types, is_current
+
+
+def save_snapshot(parsers, filename):
+    """Save the analyzed formats of many parsers in a snapshot file.
+    Use :func:`load_snapshot()` in a later process to recreate these parsers
+    without analyzing their formats again (faster startup).
+
+    NOTE: The snapshot file uses the pickle format.
+    Load only snapshot files that you trust.
+
+    Only parsers of this module (:class:`Parser` and its subclasses) are
+    supported. Parsers of :mod:`parse_type.cfparse` are based on the
+    external :mod:`parse` module, which provides no analyzed format state.
+
+    :param parsers:  Parsers to save (as iterable).
+    :param filename: Snapshot file to write.
+    :raises TypeError: If a parser is no :class:`Parser` instance.
+    """
+    states = []
+    for parser in parsers:
+        if not isinstance(parser, Parser):
+            raise TypeError(
+                "save_snapshot: Unsupported parser %r (expected: %s.Parser)"
+                % (parser, __name__)
+            )
+        states.append(parser.snapshot())
+    with open(filename, "wb") as f:
+        pickle.dump(states, f, pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(filename, extra_types=None, parser_class=None):
+    """Load the parsers from a snapshot file (see: :func:`save_snapshot()`).
+    The type converters of extra types are bound lazily by their type name
+    (from "extra_types" or from the type registry).
+
+    :param filename: Snapshot file to read.
+    :param extra_types:  Type dictionary with type converters (or None).
+    :param parser_class: Parser class to use (default: Parser).
+    :return: List of parsers (in the saved order).
+    :raises ValueError: If the snapshot version is not supported
+        or if a type of the snapshot is unknown.
+    """
+    parser_class = parser_class or Parser
+    with open(filename, "rb") as f:
+        states = pickle.load(f)
+    return [parser_class.from_snapshot(state, extra_types) for state in states]
+
+
+def parse(
+    format,
+    string,
+    extra_types=None,
+    evaluate_result=True,
+    case_sensitive=False,
+    spans=True,
+):
     """Using "format" attempt to pull values from "string".
 
     The format must match the string contents exactly. If the value
@@ -963,14 +2821,19 @@ def parse(format, string, extra_types=None, evaluate_result=True, case_sensitive
     The default behaviour is to match strings case insensitively. You may match with
     case by specifying case_sensitive=True.
 
+    Use spans=False if you do not need the match spans of the Result(s).
+
     If the format is invalid a ValueError will be raised.
 
     See the module documentation for the use of "extra_types".
 
     In the case there is no match parse() will return None.
+
+    The compiled Parser for a format is shared by all calls
+    (see: parser_cache).
     """
-    p = Parser(format, extra_types=extra_types, case_sensitive=case_sensitive)
-    return p.parse(string, evaluate_result=evaluate_result)
+    p = parser_cache.get(format, extra_types=extra_types, case_sensitive=case_sensitive)
+    return p.parse(string, evaluate_result=evaluate_result, spans=spans)
 
 
 def search(
@@ -981,6 +2844,7 @@ def search(
     extra_types=None,
     evaluate_result=True,
     case_sensitive=False,
+    spans=True,
 ):
     """Search "string" for the first occurrence of "format".
 
@@ -1004,14 +2868,16 @@ def search(
     The default behaviour is to match strings case insensitively. You may match with
     case by specifying case_sensitive=True.
 
+    Use spans=False if you do not need the match spans of the Result(s).
+
     If the format is invalid a ValueError will be raised.
 
     See the module documentation for the use of "extra_types".
 
     In the case there is no match parse() will return None.
     """
-    p = Parser(format, extra_types=extra_types, case_sensitive=case_sensitive)
-    return p.search(string, pos, endpos, evaluate_result=evaluate_result)
+    p = parser_cache.get(format, extra_types=extra_types, case_sensitive=case_sensitive)
+    return p.search(string, pos, endpos, evaluate_result=evaluate_result, spans=spans)
 
 
 def findall(
@@ -1022,6 +2888,7 @@ def findall(
     extra_types=None,
     evaluate_result=True,
     case_sensitive=False,
+    spans=True,
 ):
     """Search "string" for all occurrences of "format".
 
@@ -1044,12 +2911,14 @@ def findall(
     The default behaviour is to match strings case insensitively. You may match with
     case by specifying case_sensitive=True.
 
+    Use spans=False if you do not need the match spans of the Result(s).
+
     If the format is invalid a ValueError will be raised.
 
     See the module documentation for the use of "extra_types".
     """
-    p = Parser(format, extra_types=extra_types, case_sensitive=case_sensitive)
-    return p.findall(string, pos, endpos, evaluate_result=evaluate_result)
+    p = parser_cache.get(format, extra_types=extra_types, case_sensitive=case_sensitive)
+    return p.findall(string, pos, endpos, evaluate_result=evaluate_result, spans=spans)
 
 
 def compile(format, extra_types=None, case_sensitive=False):
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+r"""
+Provides a named type registry for type converters.
+
+Type converters that are registered by name are pickled as reference
+to their name (instead of the converter function itself). This allows
+to pickle parsers and type converters (built by the :class:`TypeBuilder`)
+that use lambdas or closures as type converter. The receiving process
+(for example: a worker process) must register the same type converters
+with the same names before it unpickles them.
+
+.. code-block:: python
+
+    from parse_type.registry import register_type
+
+    parse_word = lambda text: text.upper()
+    parse_word.pattern = r"\w+"
+    register_type("Word", parse_word)
+"""
+
+from __future__ import absolute_import
+
+
+class IdentityKey(object):
+    """Hashable key that compares an object by its identity
+    (and keeps the object alive while the key is used).
+    """
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, IdentityKey) and self.obj is other.obj
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class TypeRegistry(object):
+    """Registry of named type converters.
+    A type converter may be registered with several names.
+    """
+
+    def __init__(self):
+        self._types = {}
+        self._names = {}    # -- REVERSE MAPPING: converter -> names (ordered)
+
+    def __contains__(self, name):
+        return name in self._types
+
+    def register(self, name, converter):
+        """Register a type converter by name (replaces an existing one)."""
+        assert callable(converter)
+        if name in self._types:
+            self.unregister(name)
+        self._types[name] = converter
+        names = self._names.setdefault(IdentityKey(converter), {})
+        names[name] = None
+
+    def register_types(self, type_dict):
+        """Register all type converters of a type dictionary."""
+        for name, converter in type_dict.items():
+            self.register(name, converter)
+
+    def unregister(self, name):
+        converter = self._types.pop(name)
+        key = IdentityKey(converter)
+        names = self._names.get(key)
+        if names is not None:
+            names.pop(name, None)
+            if not names:
+                del self._names[key]
+
+    def lookup(self, name):
+        """Return the type converter for this name.
+
+        :raises: KeyError, if no type converter is registered with this name.
+        """
+        return self._types[name]
+
+    def name_of(self, converter):
+        """Return the (first) name of a registered type converter (or None)."""
+        names = self._names.get(IdentityKey(converter))
+        if not names:
+            return None
+        return next(iter(names))
+
+    def clear(self):
+        self._types.clear()
+        self._names.clear()
+
+
+# -- PROCESS-WIDE TYPE REGISTRY: Used when type converters are (un)pickled.
+type_registry = TypeRegistry()
+
+
+def register_type(name, converter):
+    """Register a type converter by name in the process-wide type registry."""
+    type_registry.register(name, converter)
+
+
+def lookup_type(name):
+    """Return the type converter by name from the process-wide type registry."""
+    return type_registry.lookup(name)
+
+
+class TypeVariantCache(object):
+    """Process-wide cache of derived type variants (like: cardinality variants).
+    A type variant is built once per key and is shared by all parsers.
+    The key should contain the base type converter (not its id),
+    so that the base type converter is kept alive while it is cached.
+    """
+    MAXSIZE = 4096
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize or self.MAXSIZE
+        self._variants = {}
+
+    def __len__(self):
+        return len(self._variants)
+
+    def get_or_create(self, key, make_variant):
+        """Return the cached type variant or create (and cache) it.
+
+        :param key:  Cache key, like: (converter, cardinality, listsep).
+        :param make_variant:  Callable without args that creates the variant.
+        :return: Type variant (type converter).
+        """
+        try:
+            return self._variants[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # -- UNHASHABLE: Type converter cannot be used as key (not cached).
+            return make_variant()
+
+        variant = make_variant()
+        if len(self._variants) >= self.maxsize:
+            self._variants.clear()
+        self._variants[key] = variant
+        return variant
+
+    def clear(self):
+        self._variants.clear()
+
+
+# -- PROCESS-WIDE TYPE VARIANT CACHE: Used by the CardinalityFieldTypeBuilder.
+type_variant_cache = TypeVariantCache()
+
+
+class TypeRef(object):
+    """Pickle placeholder for a registered type converter.
+    It is unpickled as the type converter that is registered with this name.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __reduce__(self):
+        return (lookup_type, (self.name,))
+
+
+def type_ref(converter):
+    """Return a picklable reference to a type converter.
+
+    :param converter: Type converter to use.
+    :return: TypeRef, if the type converter is registered. Otherwise, converter.
+    """
+    name = type_registry.name_of(converter)
+    if name is None:
+        return converter
+    return TypeRef(name)
@@ -109,6 +109,9 @@ setup(
         "pytest-html >= 1.19.0",
     ],
     extras_require={
+        "regex": [
+            "regex >= 2021.8.3",
+        ],
         "docs": [
             "Sphinx >=1.6",
             "sphinx_bootstrap_theme >= 0.6.0"
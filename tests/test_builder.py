@@ -14,6 +14,7 @@ from .parse_type_test import ParseTypeTestCase
 from .parse_type_test \
     import parse_number, parse_yesno, parse_person_choice, parse_color, Color
 from parse_type import TypeBuilder, build_type_dict
+from parse_type.cardinality import pattern_group_count
 from enum import Enum
 
 
@@ -102,6 +103,50 @@ class TestTypeBuilder4Enum(ParseTypeTestCase):
         self.assert_mismatch(parser, "Answer: redx",    "color")
         self.assert_mismatch(parser, "Answer: redx ZZZ", "color")
 
+    def test_make_enum_with_mixed_case_names(self):
+        parse_answer = TypeBuilder.make_enum({"Yes": True, "NO": False})
+        schema = "Answer: {answer:Answer}"
+        parser = parse.Parser(schema, dict(Answer=parse_answer))
+
+        # -- IGNORE-CASE: Case-folded names are used on exact-case mismatch.
+        self.assert_match(parser, "Answer: Yes", "answer", True)
+        self.assert_match(parser, "Answer: YES", "answer", True)
+        self.assert_match(parser, "Answer: no",  "answer", False)
+        self.assertRaises(KeyError, parse_answer, "maybe")
+
+    def test_make_enum_pattern_uses_longest_name_first(self):
+        parse_enum = TypeBuilder.make_enum({"on": 1, "one": 2, "o": 3})
+        self.assertEqual(parse_enum.pattern, "o(?:n(?:e)?)?")
+        schema = "Value: {value:Enum}"
+        parser = parse.Parser(schema, dict(Enum=parse_enum))
+        self.assert_match(parser, "Value: one", "value", 2)
+        self.assert_match(parser, "Value: on",  "value", 1)
+        self.assert_match(parser, "Value: o",   "value", 3)
+
+    def test_make_enum_pattern_shares_common_prefix(self):
+        parse_enum = TypeBuilder.make_enum({"apple": 1, "ant": 2})
+        self.assertEqual(parse_enum.pattern, "a(?:nt|pple)")
+        self.assertEqual(pattern_group_count(parse_enum.pattern), 0)
+
+    def test_make_enum_with_many_and_next_field(self):
+        # -- ENSURE: Non-capturing trie groups do not shift the field groups.
+        parse_enum = TypeBuilder.make_enum({"apple": 1, "ant": 2, "a": 3})
+        parse_enums = TypeBuilder.with_many(parse_enum)
+        schema = "Values: {values:Enums}, {number:d}"
+        parser = parse.Parser(schema, dict(Enums=parse_enums))
+        result = parser.parse("Values: ant, a, apple, 42")
+        self.assertEqual(result["values"], [2, 3, 1])
+        self.assertEqual(result["number"], 42)
+
+    def test_make_enum_pattern_escapes_names(self):
+        parse_enum = TypeBuilder.make_enum({"a.b": 1, "a+": 2, "x(y)": 3})
+        schema = "Value: {value:Enum}"
+        parser = parse.Parser(schema, dict(Enum=parse_enum))
+        self.assert_match(parser, "Value: a.b",  "value", 1)
+        self.assert_match(parser, "Value: a+",   "value", 2)
+        self.assert_match(parser, "Value: x(y)", "value", 3)
+        self.assert_mismatch(parser, "Value: axb", "value")
+
 
 # -----------------------------------------------------------------------------
 # TEST CASE: TestTypeBuilder4Choice
@@ -266,6 +311,34 @@ class TestTypeBuilder4Choice(ParseTypeTestCase):
             with self.assertRaises(ValueError):
                 parser.parse(input_text)
 
+    def test_make_choice2__with_many_choices(self):
+        choices = ["service%04d" % index for index in range(2000)]
+        parse_choice2 = TypeBuilder.make_choice2(choices)
+        self.assertEqual(parse_choice2("service1999"), (1999, "service1999"))
+        self.assertEqual(parse_choice2("service0000"), (0, "service0000"))
+        self.assertRaises(ValueError, parse_choice2, "SERVICE0001")
+        self.assertTrue(parse_choice2.pattern.startswith("service"))
+
+        schema = "Service: {service:Service}, {number:d}"
+        parser = parse.Parser(schema, dict(Service=parse_choice2))
+        result = parser.parse("Service: service0042, 12")
+        self.assertEqual(result["service"], (42, "service0042"))
+        self.assertEqual(result["number"], 12)
+
+    def test_make_choice2__anycase_accepted_case_insensitive(self):
+        # -- NOTE: strict=False => Case-folded lookup (re.IGNORECASE).
+        parse_choice2 = TypeBuilder.make_choice2(["Zero", "one", "TWO"],
+                                                 strict=False)
+        schema = "Answer: {answer:NumberWordChoice}"
+        parser = parse.Parser(schema, dict(NumberWordChoice=parse_choice2))
+
+        # -- PERFORM TESTS: Index of the case-folded choice, text as parsed.
+        self.assert_match(parser, "Answer: zero", "answer", (0, "zero"))
+        self.assert_match(parser, "Answer: ONE",  "answer", (1, "ONE"))
+        self.assert_match(parser, "Answer: Two",  "answer", (2, "Two"))
+        self.assertEqual(parse_choice2.index_of("tWo"), 2)
+        self.assertEqual(parse_choice2.index_of("three"), None)
+
 # -----------------------------------------------------------------------------
 # TEST CASE: TestTypeBuilder4Variant
 # -----------------------------------------------------------------------------
@@ -391,6 +464,40 @@ class TestTypeBuilder4Variant(ParseTypeTestCase):
         self.assertEqual(result["variant"], False)
 
 
+    def test_make_variant__dispatches_by_match_group(self):
+        # -- REQUIRES: parse_type.parse.Parser (passes match and group number)
+        from parse_type import parse as parse2
+        def parse_decimal(text):
+            return float(text)
+        parse_decimal.pattern = r"\d+\.\d+"
+        parse_variant = TypeBuilder.make_variant([parse_number, parse_decimal])
+        schema = "{:d} {variant:Number_or_Decimal} {:Number_or_Decimal}"
+        parser = parse2.Parser(schema, dict(Number_or_Decimal=parse_variant))
+
+        result = parser.parse("1 2.5 42")
+        self.assertEqual(result.fixed, (1, 42))
+        self.assertEqual(result["variant"], 2.5)
+        self.assertEqual(parse_variant.alternatives[1][0], 2)
+
+    def test_make_variant__with_noncapturing_and_escaped_parens(self):
+        # -- ENSURE: Group offsets and regex_group_count use the same count.
+        from parse_type import parse as parse2
+        def parse_call(text):
+            return text
+        parse_call.pattern = r"\w+\(\)"
+        def parse_hex(text):
+            return int(text[:-1], 16)
+        parse_hex.pattern = r"(?:0x)?[0-9a-f]+h"
+        parse_variant = TypeBuilder.make_variant([parse_call, parse_hex,
+                                                  parse_number])
+        self.assertEqual(parse_variant.regex_group_count, 3)
+        self.assertEqual([a[0] for a in parse_variant.alternatives], [1, 2, 3])
+
+        schema = "{:Variant} {:Variant} {:Variant} {:d}"
+        parser = parse2.Parser(schema, dict(Variant=parse_variant))
+        result = parser.parse("run() 0x1fh 42 7")
+        self.assertEqual(result.fixed, ("run()", 0x1f, 42, 7))
+
     def test_make_variant__with_color_or_person(self):
         type_converters = [parse_color, parse_person_choice]
         parse_variant2 = TypeBuilder.make_variant(type_converters)
@@ -9,6 +9,7 @@ from .parse_type_test import ParseTypeTestCase, parse_number
 from parse_type import Cardinality, TypeBuilder, build_type_dict
 from parse import Parser
 import parse
+import re
 import unittest
 
 # -----------------------------------------------------------------------------
@@ -98,6 +99,16 @@ class TestCardinality(ParseTypeTestCase):
         self.assertEqual(new_pattern, expected)
         self.check_pattern_for_cardinality_one_or_more(pattern, new_pattern)
 
+    def test_make_items_pattern(self):
+        pattern = Cardinality.many.make_items_pattern(r"\d+,\d+", listsep=";")
+        self.assertEqual(pattern, r"(?:\A\s*|\s*;\s*)(\d+,\d+)(?=\s*;|\s*\Z)")
+
+    def test_compute_group_count_ignores_noncapturing_groups(self):
+        pattern = r"a(?:nt|pple)|\(x\)"
+        self.assertEqual(Cardinality.one.compute_group_count(pattern), 0)
+        self.assertEqual(Cardinality.many.compute_group_count(pattern), 3)
+        self.assertEqual(Cardinality.many.compute_group_count(r"(\d+)"), 5)
+
     def test_is_many(self):
         is_many_true_valueset = set(
             [Cardinality.zero_or_more, Cardinality.one_or_more])
@@ -331,6 +342,65 @@ class TestTypeBuilder4Cardinality(CardinalityTypeBuilderTest):
         self.assert_match(parser, "List: 1; 2",    "numbers", [ 1, 2 ])
         self.assert_match(parser, "List: 1; 2; 3", "numbers", [ 1, 2, 3 ])
 
+    def test_with_one_or_more_with_bulk_converter(self):
+        calls = []
+        def parse_item(text):
+            raise AssertionError("NOT-CALLED: Uses convert_many instead")
+        def convert_many(texts):
+            calls.append(texts)
+            return [int(text) * 10 for text in texts]
+        parse_item.pattern = r"\d+"
+        parse_item.convert_many = convert_many
+
+        parse_numbers = TypeBuilder.with_one_or_more(parse_item)
+        self.assertEqual(parse_numbers("1, 2 ,3"), [10, 20, 30])
+        self.assertEqual(calls, [["1", "2", "3"]])
+
+        parse_numbers0 = TypeBuilder.with_zero_or_more(parse_item)
+        self.assertEqual(parse_numbers0("  "), [])
+        self.assertEqual(parse_numbers0("4"), [40])
+
+    def test_with_one_or_more_with_listsep_in_items(self):
+        def parse_decimal(text):
+            return float(text.replace(",", "."))
+        parse_decimal.pattern = r"\d+,\d+"
+
+        parse_decimals = TypeBuilder.with_many(parse_decimal, capture=True)
+        parse_decimals.name = "Decimals"
+        parser = parse.Parser("List: {values:Decimals}",
+                              build_type_dict([parse_decimals]))
+
+        # -- PERFORM TESTS:
+        self.assert_match(parser, "List: 1,5", "values", [1.5])
+        self.assert_match(parser, "List: 1,5, 2,25 ,3,0", "values", [1.5, 2.25, 3.0])
+        self.assert_mismatch(parser, "List: 1,5, 2", "values")
+
+    def test_with_many_with_capture_and_case_sensitivity(self):
+        def parse_pair(text):
+            return tuple(text.split(","))
+        parse_pair.pattern = r"[a-z]+,[a-z]+"
+
+        parse_pairs = TypeBuilder.with_many(parse_pair, capture=True)
+        self.assertFalse(parse_pairs.items_regex.flags & re.IGNORECASE)
+        for case_sensitive in (True, False):
+            parser = parse.Parser("{values:Pairs}", dict(Pairs=parse_pairs),
+                                  case_sensitive=case_sensitive)
+            self.assert_match(parser, "a,b, c,d", "values", [("a", "b"), ("c", "d")])
+        # -- CASE-INSENSITIVE PARSER: Items in other case are captured, too.
+        parser = parse.Parser("{values:Pairs}", dict(Pairs=parse_pairs))
+        self.assert_match(parser, "A,b, c,D", "values", [("A", "b"), ("c", "D")])
+
+    def test_with_zero_or_more_with_capture(self):
+        parse_numbers = TypeBuilder.with_many0(parse_number, capture=True)
+        self.assertEqual(parse_numbers(""), [])
+        self.assertEqual(parse_numbers("1 ,2, 3"), [1, 2, 3])
+
+    def test_with_many_of_many(self):
+        # -- ENSURE: Bulk conversion of items is not used for nested lists.
+        parse_numbers = TypeBuilder.with_many(parse_number, listsep=";")
+        parse_lists = TypeBuilder.with_many(parse_numbers, listsep=",")
+        self.assertEqual(parse_lists("1; 2, 3"), [[1, 2], [3]])
+
     def test_with_cardinality_one(self):
         parse_number2 = TypeBuilder.with_cardinality(Cardinality.one, parse_number)
         assert parse_number2 is parse_number
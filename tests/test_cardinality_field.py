@@ -187,6 +187,28 @@ class TestCardinalityFieldTypeBuilder(CardinalityTypeBuilderTest):
                                                     dict(Number=parse_number))
             self.assertTrue(callable(parse_candidate))
 
+    def test_create_type_variant__is_shared_per_type_converter_identity(self):
+        class EqualConverter(object):
+            pattern = r"\d+"
+            def __init__(self, factor):
+                self.factor = factor
+            def __call__(self, text):
+                return int(text) * self.factor
+            def __eq__(self, other):
+                return isinstance(other, EqualConverter)
+            def __hash__(self):
+                return 0
+
+        type_builder = CardinalityFieldTypeBuilder
+        converter1 = EqualConverter(1)
+        converter2 = EqualConverter(10)
+        parse_numbers1 = type_builder.create_type_variant("Number+", converter1)
+        parse_numbers2 = type_builder.create_type_variant("Number+", converter2)
+        self.assertIs(parse_numbers1,
+                      type_builder.create_type_variant("Number+", converter1))
+        self.assertIsNot(parse_numbers1, parse_numbers2)
+        self.assertEqual(parse_numbers2("1, 2"), [10, 20])
+
     def test_create_type_variant__raises_error_with_invalid_type_name(self):
         type_builder = CardinalityFieldTypeBuilder
         for invalid_type_name in TestCardinalityField.INVALID_TYPE_NAMES:
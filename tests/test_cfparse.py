@@ -52,7 +52,7 @@ class TestParser(ParseTypeTestCase):
         # -- ENSURE: Missing type variant is created.
         schema = "OptionalNumber: {number:Number?}"
         parser = Parser(schema, existing_types)
-        self.assertTrue("Number?" in existing_types)
+        self.assertFalse("Number?" in existing_types)  #< Caller dict unchanged.
 
         # -- ENSURE: Newly created type variant is usable.
         self.assert_match(parser, "OptionalNumber: 42",  "number", 42)
@@ -70,7 +70,7 @@ class TestParser(ParseTypeTestCase):
         # -- ENSURE: Missing type variant is created.
         schema = "List: {numbers:Number+}"
         parser = Parser(schema, existing_types)
-        self.assertTrue("Number+" in existing_types)
+        self.assertFalse("Number+" in existing_types)  #< Caller dict unchanged.
 
         # -- ENSURE: Newly created type variant is usable.
         self.assert_match(parser, "List: 42",  "numbers", [42])
@@ -93,7 +93,7 @@ class TestParser(ParseTypeTestCase):
         # -- ENSURE: Missing type variant is created.
         schema = "List: {numbers:Number+}"
         parser = Parser(schema, existing_types, type_builder=type_builder)
-        self.assertTrue("Number+" in existing_types)
+        self.assertFalse("Number+" in existing_types)  #< Caller dict unchanged.
 
         # -- ENSURE: Newly created type variant is usable.
         # NOTE: Use other list separator.
@@ -113,7 +113,7 @@ class TestParser(ParseTypeTestCase):
         # -- ENSURE: Missing type variant is created.
         schema = "List0: {numbers:Number*}"
         parser = Parser(schema, existing_types)
-        self.assertTrue("Number*" in existing_types)
+        self.assertFalse("Number*" in existing_types)  #< Caller dict unchanged.
 
         # -- ENSURE: Newly created type variant is usable.
         self.assert_match(parser, "List0: 42",  "numbers", [42])
@@ -158,6 +158,52 @@ class TestParser(ParseTypeTestCase):
             new_types2 = Parser.create_missing_types(schema, existing_types2)
             self.assertEqual(len(new_types2), 0)
 
+    def test_create_missing_types__reuses_cached_type_variants(self):
+        existing_types = dict(Number=parse_number)
+        new_types1 = Parser.create_missing_types("{:Number+}", existing_types)
+        new_types2 = Parser.create_missing_types("{:Number+}", existing_types)
+        self.assertIs(new_types1["Number+"], new_types2["Number+"])
+
+        # -- DIFFERENT CARDINALITY: Other type variant.
+        new_types3 = Parser.create_missing_types("{:Number*}", existing_types)
+        self.assertIsNot(new_types3["Number*"], new_types1["Number+"])
+
+    def test_create_missing_types__with_other_listsep_uses_other_variant(self):
+        class MyCardinalityFieldTypeBuilder(CardinalityFieldTypeBuilder):
+            listsep = ';'
+
+        existing_types = dict(Number=parse_number)
+        new_types1 = Parser.create_missing_types("{:Number+}", existing_types)
+        new_types2 = Parser.create_missing_types("{:Number+}", existing_types,
+                                    MyCardinalityFieldTypeBuilder)
+        self.assertIsNot(new_types1["Number+"], new_types2["Number+"])
+        self.assertEqual(new_types2["Number+"].listsep, ";")
+
+    def test_create_type_variant__with_other_type_builder_uses_other_variant(self):
+        class MyCardinalityFieldTypeBuilder(CardinalityFieldTypeBuilder):
+            @classmethod
+            def make_type_variant(cls, type_name, type_converter, cardinality):
+                type_variant = super(MyCardinalityFieldTypeBuilder, cls) \
+                    .make_type_variant(type_name, type_converter, cardinality)
+                type_variant.custom = True
+                return type_variant
+
+        variant1 = CardinalityFieldTypeBuilder.create_type_variant(
+                        "Number+", parse_number)
+        variant2 = MyCardinalityFieldTypeBuilder.create_type_variant(
+                        "Number+", parse_number)
+        self.assertIsNot(variant1, variant2)
+        self.assertTrue(getattr(variant2, "custom", False))
+
+    def test_create_type_variant__with_other_type_name_keeps_its_name(self):
+        variant1 = CardinalityFieldTypeBuilder.create_type_variant(
+                        "Number+", parse_number)
+        variant2 = CardinalityFieldTypeBuilder.create_type_variant(
+                        "Integer+", parse_number)
+        self.assertIsNot(variant1, variant2)
+        self.assertEqual(variant1.name, "Number+")
+        self.assertEqual(variant2.name, "Integer+")
+
 
 # -----------------------------------------------------------------------------
 # MAIN:
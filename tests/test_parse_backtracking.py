@@ -0,0 +1,92 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the options of :class:`parse_type.parse.Parser` that reduce
+regex backtracking: ``delimited``, ``atomic`` and ``timeout``.
+"""
+
+from __future__ import absolute_import, print_function
+import os
+import pickle
+import subprocess
+import sys
+import pytest
+from parse_type import parse
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+requires_regex = pytest.mark.skipif(regex is None, reason="REQUIRES: regex module")
+ADVERSARIAL_TEXT = "a " * 300 + "bx;"
+
+
+@pytest.mark.parametrize("format, expected", [
+    ("{},{}", r"([^,]+),(.+?)"),
+    ("{name}: {:d}", r"(?P<name>[^:]+): ([-+ ]?\d+|[-+ ]?0[xX][0-9a-fA-F]+|[-+ ]?0[bB][01]+|[-+ ]?0[oO][0-7]+)"),
+    ("{a} {a}.", r"(?P<a>[^\ ]+) (?P=a)\."),
+    ("{}{{", r"([^\{]+)\{"),
+    ("{}{}", r"(.+?)(.+?)"),
+    ("{:w},", r"(\w+),"),
+])
+def test_delimited_fields(format, expected):
+    assert parse.Parser(format, delimited=True)._expression == expected
+
+
+def test_delimited_fields_can_not_contain_their_delimiter():
+    parser = parse.Parser("{}:{:d}", delimited=True)
+    assert parser.parse("a:1")[0] == "a"
+    assert parser.parse("a:b:1") is None
+    assert parse.Parser("{}:{:d}").parse("a:b:1")[0] == "a:b"
+
+
+def test_delimited_fields_avoid_backtracking():
+    parser = parse.Parser("{} {} {} {:d}x;", delimited=True)
+    assert parser.parse(ADVERSARIAL_TEXT) is None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="REQUIRES: Python >= 3.11")
+def test_atomic_delimited_fields():
+    parser = parse.Parser("{},{}", delimited=True, atomic=True)
+    assert parser._expression == r"([^,]++),(.+?)"
+    assert parser.parse("a,b,c").fixed == ("a", "b,c")
+
+
+@requires_regex
+def test_timeout_aborts_runaway_match():
+    parser = parse.Parser("{} {} {} {:d}x;", timeout=0.05)
+    with pytest.raises(TimeoutError):
+        parser.parse(ADVERSARIAL_TEXT)
+
+
+@requires_regex
+def test_parser_with_timeout():
+    parser = parse.Parser("{:d} {name}", timeout=1.0)
+    assert parser.parse("12 Alice").named == dict(name="Alice")
+    assert parser.search("x 12 Alice")[0] == 12
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2._timeout == 1.0
+
+
+@requires_regex
+def test_parser_set_uses_timeout_of_parsers():
+    parser = parse.Parser("{} {} {} {:d}x;", timeout=0.05)
+    parser_set = parse.ParserSet([parser, parse.Parser("{:d}")])
+    assert parser_set._timeout == 0.05
+    with pytest.raises(TimeoutError):
+        parser_set.parse(ADVERSARIAL_TEXT)
+
+
+def test_regex_module_is_imported_on_first_use_only():
+    code = "import sys, parse_type.parse; print('regex' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code],
+                                     cwd=os.path.dirname(os.path.dirname(
+                                         os.path.abspath(__file__))))
+    assert output.strip() == b"False"
+
+
+def test_parser_options_are_pickled():
+    parser = parse.Parser("{},{}", delimited=True, case_sensitive=True)
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2._expression == parser._expression
+    assert not (parser2._re_flags & parse.re.IGNORECASE)
@@ -0,0 +1,63 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the bytes mode of :class:`parse_type.parse.Parser`
+(search/findall on bytes-like objects, like: mmap).
+"""
+
+from __future__ import absolute_import, print_function
+from datetime import datetime
+import mmap
+import pickle
+from parse_type import parse
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+
+def test_parser_with_bytes_format():
+    parser = parse.Parser(b"{:d} {name} {value:f}")
+    result = parser.parse(b"42 Alice 1.5")
+    assert parser.encoding == "utf-8"
+    assert result.fixed == (42,)
+    assert result.named == dict(name=b"Alice", value=1.5)
+    assert result.spans == {0: (0, 2), "name": (3, 8), "value": (9, 12)}
+
+
+def test_parser_with_bytes_format_and_user_type():
+    parser = parse.Parser(b"Number: {:Number}", dict(Number=parse_number))
+    assert parser.parse(b"number: 12")[0] == 12
+
+
+def test_parser_with_bytes_format_and_datetime_type():
+    parser = parse.Parser(b"at {when:ti}")
+    result = parser.parse(b"at 2020-01-02 10:11")
+    assert result["when"] == datetime(2020, 1, 2, 10, 11)
+
+
+def test_parser_with_text_format_and_encoding():
+    parser = parse.Parser(u"Größe: {:d}", encoding="latin-1")
+    assert parser.parse(u"Größe: 12".encode("latin-1"))[0] == 12
+
+
+def test_findall_on_mmap(tmp_path):
+    filename = tmp_path/"data.txt"
+    filename.write_bytes(b"head <1|a> middle <2|b>\n<3|c> tail")
+    parser = parse.Parser(b"<{:d}|{:w}>")
+    with open(str(filename), "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            results = [r.fixed for r in parser.findall(data)]
+            result = parser.search(data, pos=10)
+            assert result.fixed == (2, b"b")
+            assert result.spans[0] == (19, 20)
+        finally:
+            data.close()
+    assert results == [(1, b"a"), (2, b"b"), (3, b"c")]
+
+
+def test_parser_in_bytes_mode_can_be_pickled():
+    parser = parse.Parser(b"{:d}")
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2.parse(b"12")[0] == 12
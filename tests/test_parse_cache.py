@@ -0,0 +1,106 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the parser cache in :mod:`parse_type.parse` that is used by
+the module-level functions ``parse()``, ``search()`` and ``findall()``.
+"""
+
+from __future__ import absolute_import, print_function
+import pytest
+from parse_type import parse
+from parse_type.parse import ParserCache
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+
+@pytest.fixture
+def cache():
+    return ParserCache(maxsize=2)
+
+
+def test_cache_returns_shared_parser(cache):
+    parser1 = cache.get("{:d} apples")
+    parser2 = cache.get("{:d} apples")
+    assert parser1 is parser2
+    assert cache.info() == (1, 1, 0, 2, 1)
+
+
+def test_cache_key_uses_case_sensitive_flag(cache):
+    parser1 = cache.get("Hello {}")
+    parser2 = cache.get("Hello {}", case_sensitive=True)
+    assert parser1 is not parser2
+    assert parser2.parse("hello World") is None
+
+
+def test_cache_key_uses_extra_types(cache):
+    def parse_word(text):
+        return text.upper()
+
+    parser1 = cache.get("{:Value}", extra_types=dict(Value=parse_number))
+    parser2 = cache.get("{:Value}", extra_types=dict(Value=parse_word))
+    assert parser1 is not parser2
+    assert parser1.parse("42")[0] == 42
+    assert parser2.parse("abc")[0] == "ABC"
+
+
+def test_cache_key_keeps_type_converters_alive(cache):
+    # -- AVOID: A new type converter may reuse the id() of a collected one.
+    extra_types = dict(Number=lambda text: int(text))
+    cache.get("{:Number}", extra_types)
+    key = ParserCache.make_key("{:Number}", extra_types)
+    converter = extra_types.pop("Number")
+    assert key[2][0][1].obj is converter
+    assert cache._parsers[key] is not None
+
+
+def test_cached_parser_uses_copy_of_extra_types(cache):
+    extra_types = dict(Number=parse_number)
+    parser = cache.get("{:Number}", extra_types)
+    extra_types["Other"] = parse_number
+    assert "Other" not in parser._extra_types
+    assert parser.parse("42")[0] == 42
+
+
+def test_cache_evicts_least_recently_used_parser(cache):
+    parser1 = cache.get("{a}")
+    cache.get("{b}")
+    cache.get("{a}")    # -- MAKE: Most recently used.
+    cache.get("{c}")    # -- EVICTS: "{b}"
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("{a}") is parser1
+    assert cache.info().misses == 3
+
+
+def test_cache_resize_evicts_parsers(cache):
+    cache.get("{a}")
+    cache.get("{b}")
+    cache.resize(1)
+    assert cache.info() == (0, 2, 1, 1, 1)
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+
+
+def test_cache_with_maxsize_zero_is_disabled():
+    cache = ParserCache(maxsize=0)
+    assert cache.get("{a}") is not cache.get("{a}")
+    assert len(cache) == 0
+
+
+def test_cache_clear(cache):
+    cache.get("{a}")
+    cache.get("{a}")
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_module_functions_use_parser_cache():
+    parse.parser_cache.clear()
+    assert parse.parse("{:d}", "12")[0] == 12
+    assert parse.search("{:d}", "a 12 b")[0] == 12
+    assert [r[0] for r in parse.findall("{:d}", "1 2 3")] == [1, 2, 3]
+    info = parse.parser_cache.info()
+    assert info.misses == 1
+    assert info.hits == 2
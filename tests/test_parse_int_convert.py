@@ -0,0 +1,51 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the integer type converters of :mod:`parse_type.parse`
+(fast-path and slow-path must return the same values).
+"""
+
+from __future__ import absolute_import, print_function
+import pytest
+from parse_type import parse
+from parse_type.parse import int_convert
+
+
+@pytest.mark.parametrize("base, text", [
+    (None, "123"), (None, "-123"), (None, "+123"), (None, " 123"),
+    (None, "0x1F"), (None, "-0b101"), (None, "0o17"), (None, "007"),
+    (10, "1,000"), (10, "-1.000.000"), (10, " 42"),
+    (2, "0b101"), (2, "-101"), (8, "0o17"), (8, "+17"),
+    (16, "0x1f"), (16, "-1F"), (16, "ff"),
+])
+def test_int_convert_fast_path_equals_slow_path(base, text):
+    converter = int_convert(base)
+    assert converter(text, None) == converter.convert_slow(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("-1", True), ("+12", True), ("12", True),
+    ("", False), ("-", False), ("1,000", False), ("0x1", False),
+    (u"٣", False),     # ARABIC-INDIC DIGIT THREE
+])
+def test_int_convert_is_plain_decimal(text, expected):
+    assert int_convert.is_plain_decimal(text) == expected
+
+
+@pytest.mark.parametrize("format, text, expected", [
+    ("{:d}", "-42", -42),
+    ("{:n}", "1,234,567", 1234567),
+    ("{:x}", "0xff", 255),
+    ("{:b}", "0b1011", 11),
+    ("{:o}", "0o17", 15),
+])
+def test_parse_with_int_types(format, text, expected):
+    result = parse.parse(format, text)
+    assert result.fixed == (expected,)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("123", True), ("", True), ("a-Z", True), ("١٢", False), ("\xe9", False),
+])
+def test_isascii_fallback_equals_str_isascii(text, expected):
+    assert parse._isascii_fallback(text) is expected
+    assert parse._isascii(text) is expected
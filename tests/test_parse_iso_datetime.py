@@ -0,0 +1,57 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the ISO 8601 date/time type converter (type: "ti")
+of :mod:`parse_type.parse` (fast-path with ``datetime.fromisoformat()``).
+"""
+
+from __future__ import absolute_import, print_function
+from datetime import datetime
+import pytest
+from parse_type import parse
+
+
+@pytest.mark.parametrize("text", [
+    "1997-07-16",
+    "1997-07-16 19:20",
+    "1997-07-16T19:20:30",
+    "1997-07-16T19:20:30.45",
+    "1997-07-16T19:20Z",
+    "1997-07-16T19:20+0100",
+    "1997-07-16T19:20:30.45-01:00",
+    "1997-07-16T19:20 +01:00",
+    "1997-07-16  1:20",         # FALLBACK: Not supported by fromisoformat()
+])
+def test_iso_date_convert_equals_date_convert(text):
+    parser = parse.Parser("{:ti}")
+    m = parser._match_re.match(text)
+    expected = parse.date_convert(text, m, ymd=1, hms=4, tz=7)
+    actual = parser.parse(text).fixed[0]
+    assert actual == expected
+    assert actual.tzinfo == expected.tzinfo
+
+
+def test_iso_date_convert_uses_exact_microseconds():
+    parser = parse.Parser("{:ti}")
+    result = parser.parse("1997-07-16T19:20:30.000249")
+    assert result.fixed[0] == datetime(1997, 7, 16, 19, 20, 30, 249)
+
+
+def test_iso_date_convert_shares_tzinfo_objects():
+    parser = parse.Parser("{:ti} {:ti}")
+    result = parser.parse("1997-07-16T19:20+01:00 2023-01-01T00:00+01:00")
+    assert result.fixed[0].tzinfo is result.fixed[1].tzinfo
+
+
+def test_iso_date_convert_with_invalid_date_raises_error():
+    parser = parse.Parser("{:ti}")
+    with pytest.raises(ValueError):
+        parser.parse("1997-02-30")
+
+
+def test_iso_date_convert_without_fromisoformat_uses_date_convert(monkeypatch):
+    # -- SIMULATE: Python < 3.7 (no datetime.fromisoformat()).
+    monkeypatch.setattr(parse, "_has_fromisoformat", False)
+    parser = parse.Parser("{:ti}")
+    result = parser.parse("1997-07-16T19:20:30.45+01:00")
+    assert result.fixed[0] == datetime(1997, 7, 16, 19, 20, 30, 450000,
+                                       tzinfo=parse.FixedTzOffset(60, "+01:00"))
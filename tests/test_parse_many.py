@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the batch API of :class:`parse_type.parse.Parser`:
+``parse_many()``, ``search_many()``, ``parse_columns()``, ``search_columns()``.
+"""
+
+from __future__ import absolute_import, print_function
+from array import array
+import pytest
+from parse_type import parse
+
+
+def parse_word(text):
+    return text.upper()
+parse_word.pattern = r"\w+"
+
+LINES = ["1: alice 1.5", "bad line", "0x10: bob .25", "1,000: charly 2.0"]
+
+
+def test_parse_many_yields_result_or_none_per_string():
+    parser = parse.Parser("{:d}: {name} {value:f}")
+    results = list(parser.parse_many(LINES))
+    assert len(results) == 4
+    assert results[0].fixed == (1,)
+    assert results[0].named == dict(name="alice", value=1.5)
+    assert results[1] is None
+    assert results[2][0] == 16
+    assert results[3] is None
+
+
+def test_parse_many_with_result_type():
+    parser = parse.Parser("{:d}: {name} {value:f}")
+    results = list(parser.parse_many(LINES[:3], result_type=tuple))
+    assert results == [(1, "alice", 1.5), None, (16, "bob", 0.25)]
+
+
+def test_parse_many_without_evaluate_result():
+    parser = parse.Parser("{:d}: {name} {value:f}")
+    matches = list(parser.parse_many(LINES[:2], evaluate_result=False))
+    assert matches[0].evaluate_result().named["name"] == "alice"
+    assert matches[1] is None
+
+
+def test_search_many():
+    parser = parse.Parser("{value:f}")
+    results = list(parser.search_many(["a 1.5 b", "none"], spans=False))
+    assert results[0]["value"] == 1.5
+    assert results[0].spans is None
+    assert results[1] is None
+
+
+def test_parse_columns():
+    parser = parse.Parser("{:n}: {name:Word} {value:f}", dict(Word=parse_word))
+    columns = parser.parse_columns(LINES)
+    assert columns == {
+        0: [1, 1000],
+        "name": ["ALICE", "CHARLY"],
+        "value": [1.5, 2.0],
+    }
+
+
+def test_parse_columns_with_arrays():
+    parser = parse.Parser("{:d}: {name} {value:f}")
+    columns = parser.parse_columns(LINES, arrays=True)
+    assert columns[0] == array("q", [1, 16])
+    assert columns["name"] == ["alice", "bob"]
+    assert columns["value"] == array("d", [1.5, 0.25])
+
+
+def test_search_columns():
+    parser = parse.Parser("id={id:d}")
+    columns = parser.search_columns(["a id=1", "b", "c id=3 d"])
+    assert columns == {"id": [1, 3]}
+
+
+def test_parse_columns_with_non_ascii_digits_is_same_as_parse():
+    # -- ARABIC-INDIC DIGITS: Accepted by int(), but not by int_convert.
+    parser = parse.Parser("{:d}")
+    text = u"\u0661\u0662"
+    with pytest.raises(ValueError):
+        parser.parse(text)
+    with pytest.raises(ValueError):
+        parser.parse_columns([text])
@@ -0,0 +1,89 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :meth:`parse_type.parse.Parser.findall_parallel()`
+and the pickle support of :class:`parse_type.parse.Parser`.
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+from parse_type import parse
+
+TEXT = "".join("line %d: <%d|name%d>\n" % (i, i * 2, i) for i in range(500))
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+
+def as_tuples(results):
+    return [(r.fixed, r.named, r.spans) for r in results]
+
+
+def test_parser_pickles_format_and_used_types_only():
+    extra_types = dict(Number=parse_number, Unused=lambda text: text)
+    parser = parse.Parser("<{:Number}|{name}>", extra_types)
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2._expression == parser._expression
+    assert parser2.parse("<12|Alice>").fixed == (12,)
+
+
+class LabeledParser(parse.Parser):
+    def __init__(self, label, format, extra_types=None):
+        super(LabeledParser, self).__init__(format, extra_types)
+        self.label = label
+
+
+def test_parser_subclass_with_other_init_signature_can_be_pickled():
+    parser = LabeledParser("numbers", "<{:Number}>", dict(Number=parse_number))
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert isinstance(parser2, LabeledParser)
+    assert parser2.label == "numbers"
+    assert parser2.parse("<12>").fixed == (12,)
+
+
+def test_findall_parallel_in_process_does_not_keep_parser():
+    parser = parse.Parser("<{:d}|{name:w}>")
+    parse._parallel_parser = None
+    results = parser.findall_parallel(TEXT, workers=1, chunk_size=100)
+    assert len(results) == 500
+    assert parse._parallel_parser is None
+
+
+def test_findall_parallel_in_process_is_same_as_findall():
+    parser = parse.Parser("<{:d}|{name:w}>")
+    expected = as_tuples(parser.findall(TEXT))
+    results = parser.findall_parallel(TEXT, workers=1, chunk_size=100)
+    assert as_tuples(results) == expected
+    assert len(results) == 500
+
+
+def test_findall_parallel_with_worker_processes():
+    parser = parse.Parser("<{:d}|{name:w}>")
+    expected = as_tuples(parser.findall(TEXT))
+    results = parser.findall_parallel(TEXT, workers=2, chunk_size=2000)
+    assert as_tuples(results) == expected
+
+
+def test_findall_parallel_with_file(tmp_path):
+    filename = tmp_path/"data.txt"
+    filename.write_text(TEXT)
+    parser = parse.Parser("<{:d}|{name:w}>")
+    results = parser.findall_parallel(filename, workers=2, chunk_size=1000,
+                                      result_type=tuple)
+    assert results == [(i * 2, "name%d" % i) for i in range(500)]
+
+
+def test_findall_parallel_with_file_in_bytes_mode(tmp_path):
+    filename = tmp_path/"data.txt"
+    filename.write_text(TEXT)
+    parser = parse.Parser(b"<{:d}|{name:w}>")
+    results = parser.findall_parallel(filename, workers=1, chunk_size=1000)
+    assert as_tuples(results) == as_tuples(parser.findall(TEXT.encode()))
+
+
+def test_findall_parallel_with_empty_file(tmp_path):
+    filename = tmp_path/"empty.txt"
+    filename.write_text("")
+    parser = parse.Parser("<{:d}>")
+    assert parser.findall_parallel(filename) == []
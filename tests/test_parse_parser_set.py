@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :class:`parse_type.parse.ParserSet`.
+"""
+
+from __future__ import absolute_import, print_function
+import pytest
+from parse_type import parse
+
+FORMATS = {
+    "request": "GET {path} HTTP/{version}",
+    "sum": "{:d} + {:d}",
+    "person": "{name} is {age:d} years old",
+    "repeated": "{name}, {name}",
+}
+
+
+@pytest.mark.parametrize("text, expected_key, expected_fixed, expected_named", [
+    ("GET /index.html HTTP/1.1", "request", (), dict(path="/index.html", version="1.1")),
+    ("1 + 2", "sum", (1, 2), {}),
+    ("Alice is 42 years old", "person", (), dict(name="Alice", age=42)),
+    ("Bob, Bob", "repeated", (), dict(name="Bob")),
+])
+def test_parser_set_parse(text, expected_key, expected_fixed, expected_named):
+    parser_set = parse.ParserSet(FORMATS)
+    match = parser_set.parse(text)
+    assert match.key == expected_key
+    assert match.parser.format == FORMATS[expected_key]
+    assert match.result.fixed == expected_fixed
+    assert match.result.named == expected_named
+
+
+def test_parser_set_parse_mismatch():
+    parser_set = parse.ParserSet(FORMATS)
+    assert parser_set.parse("Bob, Alice") is None
+    assert parser_set.parse("POST / HTTP/1.1") is None
+
+
+def test_parser_set_uses_first_matching_format():
+    parser_set = parse.ParserSet(["{:d}", "{}"])
+    assert parser_set.parse("12").key == 0
+    assert parser_set.parse("abc").key == 1
+
+
+def test_parser_set_search_returns_leftmost_match():
+    parser_set = parse.ParserSet(["<{:d}>", "[{:w}]"])
+    match = parser_set.search("xx [abc] yy <12>")
+    assert match.key == 1
+    assert match.result.fixed == ("abc",)
+    assert match.result.spans == {0: (4, 7)}
+
+
+def test_parser_set_with_parsers_and_case_sensitivity():
+    parser_set = parse.ParserSet([
+        parse.Parser("Hello {}", case_sensitive=True),
+        parse.Parser("HELLO {:d}"),
+    ])
+    assert parser_set.parse("hello 12").key == 1
+    assert parser_set.parse("Hello 12").key == 0
+
+
+def test_parser_set_can_not_mix_text_and_bytes_formats():
+    with pytest.raises(ValueError):
+        parse.ParserSet(["{}", b"{}"])
+
+
+SUB_GROUP_FORMATS = [
+    "<{:d}>",
+    "{when:ti} {value:g} {:x}",
+    "{a.b} = {x[y]:%Y-%m-%d}",
+    "{name}: {:tg}",
+]
+SUB_GROUP_TEXTS = [
+    "1997-07-16T19:20+01:00 1.5e3 ff",
+    "x = 2023-11-21",
+    "Alice: 16/7/1997 19:20 +01:00",
+    "<12>",
+]
+
+
+@pytest.mark.parametrize("text", SUB_GROUP_TEXTS)
+def test_parser_set_result_equals_parser_result(text):
+    parser_set = parse.ParserSet(SUB_GROUP_FORMATS)
+    match = parser_set.parse(text)
+    expected = match.parser.parse(text)
+    assert match.result.fixed == expected.fixed
+    assert match.result.named == expected.named
+    assert match.result.spans == expected.spans
+
+    match = parser_set.search("... " + text)
+    expected = match.parser.search("... " + text)
+    assert match.result.fixed == expected.fixed
+    assert match.result.named == expected.named
+    assert match.result.spans == expected.spans
+
+
+def test_parser_set_does_not_match_again_with_parser(monkeypatch):
+    parser_set = parse.ParserSet(SUB_GROUP_FORMATS)
+    for parser in parser_set.parsers:
+        monkeypatch.setattr(parser, "parse", None)
+        monkeypatch.setattr(parser, "search", None)
+    assert parser_set.parse("<12>").result.fixed == (12,)
+    assert parser_set.search("xx <12>").result.fixed == (12,)
+
+
+def test_parser_set_without_evaluate_result():
+    parser_set = parse.ParserSet(SUB_GROUP_FORMATS)
+    match = parser_set.search("xx <12>", evaluate_result=False)
+    assert isinstance(match.result, parse.Match)
+    assert match.result.match.group() == "<12>"
+    assert match.result.match.span(1) == (4, 6)
+    assert match.result.evaluate_result().fixed == (12,)
+
+
+def test_parser_set_in_bytes_mode():
+    parser_set = parse.ParserSet([b"<{:d}>", b"{name:w}={value:d}"])
+    match = parser_set.parse(b"answer=42")
+    assert match.key == 1
+    assert match.result.named == {"name": b"answer", "value": 42}
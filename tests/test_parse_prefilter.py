@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the literal prefilter of :class:`parse_type.parse.Parser`
+(rejects strings without the literal text of the format before the regex).
+"""
+
+from __future__ import absolute_import, print_function
+import pytest
+from parse_type import parse
+
+
+def test_prefilter_extracts_literals():
+    parser = parse.Parser("GET {path} HTTP/{version}{{x}}")
+    assert parser._literals == ("get ", " http/", "{x}")
+    assert parser._literal_prefix == "get "
+    assert parser._literal_suffix == "{x}"
+
+
+def test_prefilter_and_result_plan_are_compiled_on_first_use():
+    parser = parse.Parser("GET {path}")
+    assert "_literals" not in parser.__dict__
+    assert "_fixed_plan" not in parser.__dict__
+    assert parser.parse("GET /")["path"] == "/"
+    assert parser.__dict__["_literals"] == ("get ",)
+    assert "_fixed_plan" in parser.__dict__
+
+
+def test_prefilter_with_case_sensitive_parser():
+    parser = parse.Parser("GET {path}", case_sensitive=True)
+    assert parser._literals == ("GET ",)
+    assert parser.parse("get /") is None
+    assert parser.parse("GET /")["path"] == "/"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("GET /index HTTP/1.1", "/index"),
+    ("get /index http/1.1", "/index"),
+    ("POST /index HTTP/1.1", None),
+    ("GET /index HTTPS/1.1", None),
+])
+def test_parse_with_prefilter(text, expected):
+    parser = parse.Parser("GET {path} HTTP/{version}")
+    result = parser.parse(text)
+    assert (result and result["path"]) == expected
+
+
+def test_search_and_findall_with_prefilter():
+    parser = parse.Parser("<{:d}>")
+    assert parser.search("no numbers") is None
+    assert list(parser.findall("no numbers")) == []
+    assert [r[0] for r in parser.findall("<1> <2>")] == [1, 2]
+
+
+def test_search_and_findall_do_not_prefilter_the_whole_string(monkeypatch):
+    # -- AVOID: O(n^2) for search loops with pos (prefilter ignores pos).
+    parser = parse.Parser("<{:d}>")
+    def fail(string, anchored=False):
+        raise AssertionError("OOPS: Prefilter is used")
+    monkeypatch.setattr(parser, "_has_literals", fail)
+    text = "<1> <2> <3>"
+    assert parser.search(text, pos=4)[0] == 2
+    assert [r[0] for r in parser.findall(text, pos=4)] == [2, 3]
+
+
+def test_search_of_whole_string_uses_prefilter(monkeypatch):
+    parser = parse.Parser("<{:d}>")
+    calls = []
+    def has_literals(string, anchored=False):
+        calls.append((string, anchored))
+        return False
+    monkeypatch.setattr(parser, "_has_literals", has_literals)
+    assert parser.search("xx <1>") is None
+    assert calls == [("xx <1>", False)]
+
+
+def test_prefilter_ignores_non_ascii_text_in_case_insensitive_mode():
+    # -- re.IGNORECASE: "ſ" (LATIN SMALL LETTER LONG S) matches "s".
+    parser = parse.Parser("s={:d}")
+    assert parser.parse(u"ſ=1")[0] == 1
+
+
+def test_parse_many_with_prefilter():
+    parser = parse.Parser("id={:d}")
+    results = list(parser.parse_many(["id=1", "other", "ID=2"]))
+    assert [r and r[0] for r in results] == [1, None, 2]
@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :class:`parse_type.parse.Result` with lazy match spans.
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+from parse_type import parse
+
+
+def test_result_computes_spans_on_first_access():
+    parser = parse.Parser("{:d} {name}")
+    result = parser.parse("42 Alice")
+    assert result._match is not None
+    assert result.spans == {0: (0, 2), "name": (3, 8)}
+    assert result._match is None
+
+
+def test_result_without_spans():
+    result = parse.Parser("{:d} {name}").parse("42 Alice", spans=False)
+    assert result.fixed == (42,)
+    assert result.named == {"name": "Alice"}
+    assert result.spans is None
+
+
+def test_search_and_findall_without_spans():
+    parser = parse.Parser("<{:d}>")
+    assert parser.search("a <1> b", spans=False).spans is None
+    results = list(parser.findall("<1> <2>", spans=False))
+    assert [r[0] for r in results] == [1, 2]
+    assert all(r.spans is None for r in results)
+
+
+def test_result_has_no_instance_dict():
+    result = parse.parse("{:d}", "12")
+    assert not hasattr(result, "__dict__")
+
+
+def test_result_can_be_pickled():
+    result = parse.parse("{:d} {name}", "42 Alice")
+    result2 = pickle.loads(pickle.dumps(result))
+    assert result2.fixed == (42,)
+    assert result2.named == {"name": "Alice"}
+    assert result2.spans == {0: (0, 2), "name": (3, 8)}
+
+
+def test_result_spans_after_other_thread_cleared_parser():
+    # -- SIMULATE: Another thread computed the spans and cleared _parser
+    #    (but not yet _match) between the checks of this thread.
+    parser = parse.Parser("{:d} {name}")
+    result = parser.parse("12 Alice")
+    expected = dict(result.spans)
+    result2 = parser.parse("12 Alice")
+    result2._spans = expected
+    result2._parser = None
+    assert result2.spans == expected
+
+
+def test_result_spans_from_many_threads():
+    import threading
+    parser = parse.Parser("{:d} {name}")
+    results = [parser.parse("12 Alice") for _ in range(200)]
+    errors = []
+
+    def read_spans():
+        try:
+            for result in results:
+                assert result.spans == {0: (0, 2), "name": (3, 8)}
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read_spans) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
@@ -0,0 +1,71 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the ``result_type`` option of :class:`parse_type.parse.Parser`.
+"""
+
+from __future__ import absolute_import, print_function
+from collections import namedtuple
+import pickle
+import pytest
+from parse_type import parse
+
+try:
+    from dataclasses import dataclass
+except ImportError:
+    dataclass = None
+
+
+def test_parse_with_result_type_tuple():
+    parser = parse.Parser("{:d} {name} is {age:d}")
+    result = parser.parse("1 Alice is 42", result_type=tuple)
+    assert result == (1, "Alice", 42)
+
+
+def test_parse_with_result_type_namedtuple():
+    parser = parse.Parser("{:d} {name} is {age:d}")
+    result = parser.parse("1 Alice is 42", result_type="namedtuple")
+    assert isinstance(result, parser.namedtuple_class())
+    assert result == (1, "Alice", 42)
+    assert result._0 == 1
+    assert result.name == "Alice"
+    assert result.age == 42
+
+
+def test_parse_with_result_type_class():
+    Person = namedtuple("Person", ["name", "age"])
+    parser = parse.Parser("{name} is {age:d}")
+    assert parser.parse("Alice is 42", result_type=Person) == Person("Alice", 42)
+
+
+@pytest.mark.skipif(dataclass is None, reason="REQUIRES: dataclasses")
+def test_search_with_result_type_dataclass():
+    @dataclass
+    class Item(object):
+        number: int
+        name: str
+
+    parser = parse.Parser("{:d}: {name:w}")
+    assert parser.search("# 12: Alice", result_type=Item) == Item(12, "Alice")
+
+
+def test_findall_with_result_type_tuple():
+    parser = parse.Parser("<{:d}|{:w}>")
+    results = list(parser.findall("<1|a> <2|b>", result_type=tuple))
+    assert results == [(1, "a"), (2, "b")]
+
+
+def test_parse_with_result_type_without_fields():
+    parser = parse.Parser("Hello")
+    assert parser.parse("Hello", result_type=tuple) == ()
+
+
+def test_parse_with_unsupported_result_type():
+    with pytest.raises(ValueError):
+        parse.Parser("{}").parse("x", result_type="unknown")
+
+
+def test_parser_with_result_type_can_be_pickled():
+    parser = parse.Parser("{name}: {:d}")
+    parser.parse("a: 1", result_type="namedtuple")
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2.parse("a: 1", result_type=tuple) == ("a", 1)
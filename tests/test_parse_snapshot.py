@@ -0,0 +1,195 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the parser snapshot support of :mod:`parse_type.parse`
+(see: ``Parser.snapshot()``, ``save_snapshot()``, ``load_snapshot()``).
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+from datetime import datetime
+import pytest
+from parse_type import parse, cfparse, TypeBuilder
+from parse_type.registry import type_registry, register_type
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+
+@pytest.fixture
+def registered_types():
+    yield type_registry
+    type_registry.clear()
+
+
+FORMATS = [
+    "Hello {name:w}, you are {age:d} years old",
+    "{:d} + {:f} = {result:g}",
+    "{when:ti} [{level:^8}] {message}",
+    "{date:%Y-%m-%d} {amount:n}",
+    "Number: {number:Number} {:Number}",
+    "{{literal}} {a.b} {a_b} {x[y]}",
+]
+TEXTS = [
+    "Hello Alice, you are 42 years old",
+    "1 + 2.5 = 3.5e0",
+    "2024-01-02T03:04:05 [  INFO  ] Started",
+    "2024-05-06 1,234",
+    "Number: 12 34",
+    "{literal} 1 2 3",
+]
+
+
+@pytest.mark.parametrize("format, text", list(zip(FORMATS, TEXTS)))
+def test_parser_from_snapshot_parses_like_parser(format, text):
+    extra_types = dict(Number=parse_number)
+    parser = parse.Parser(format, extra_types)
+    state = pickle.loads(pickle.dumps(parser.snapshot()))
+    parser2 = parse.Parser.from_snapshot(state, extra_types)
+
+    assert parser2._expression == parser._expression
+    result = parser.parse(text)
+    result2 = parser2.parse(text)
+    assert result2.fixed == result.fixed
+    assert result2.named == result.named
+    assert result2.spans == result.spans
+    assert parser2.search("xxx " + text).named == parser.search("xxx " + text).named
+
+
+def test_parser_from_snapshot_skips_format_analysis(monkeypatch):
+    parser = parse.Parser("{:d} {name:w}")
+    state = parser.snapshot()
+    def fail(self):
+        raise AssertionError("OOPS: Format is analyzed again")
+    monkeypatch.setattr(parse.Parser, "_generate_expression", fail)
+    parser2 = parse.Parser.from_snapshot(state)
+    assert "_fixed_plan" not in parser2.__dict__   #< Compiled on first use.
+    assert parser2.parse("12 Alice").fixed == (12,)
+    assert "_fixed_plan" in parser2.__dict__
+
+
+def test_parser_from_snapshot_binds_type_converter_lazily():
+    extra_types = dict(Number=parse_number)
+    state = parse.Parser("{:Number}", extra_types).snapshot()
+    parser2 = parse.Parser.from_snapshot(state, extra_types)
+    converter = parser2._type_conversions[0]
+    assert isinstance(converter, parse.lazy_convert)
+    assert converter._convert is None
+    assert parser2.parse("42").fixed == (42,)
+    assert converter._convert is not None
+
+
+def test_parser_from_snapshot_binds_type_converter_from_registry(registered_types):
+    register_type("Number", parse_number)
+    state = parse.Parser("{:Number}", dict(Number=parse_number)).snapshot()
+    parser2 = parse.Parser.from_snapshot(state)
+    assert parser2.parse("42").fixed == (42,)
+
+    # -- PICKLE: By type name (TypeRef).
+    parser3 = pickle.loads(pickle.dumps(parser2))
+    assert parser3.parse("43").fixed == (43,)
+
+
+def test_parser_from_snapshot_raises_error_on_unknown_type(registered_types):
+    register_type("Number", parse_number)
+    state = parse.Parser("{:Number}", dict(Number=parse_number)).snapshot()
+    type_registry.unregister("Number")
+    with pytest.raises(ValueError):
+        parse.Parser.from_snapshot(state)
+
+
+def test_parser_from_snapshot_with_changed_registered_type_is_rebuilt(registered_types):
+    state = parse.Parser("{:Number}", dict(Number=parse_number)).snapshot()
+    def parse_word(text):
+        return text.upper()
+    parse_word.pattern = r"[a-z]+"
+    register_type("Number", parse_word)
+    parser2 = parse.Parser.from_snapshot(state)
+    assert parser2.parse("abc").fixed == ("ABC",)
+
+
+def test_parser_snapshot_of_loaded_parser_keeps_type_patterns(registered_types):
+    register_type("Number", parse_number)
+    state = parse.Parser("{:Number}", dict(Number=parse_number)).snapshot()
+    parser2 = parse.Parser.from_snapshot(state)
+    state2 = parser2.snapshot()
+    assert state2["type_patterns"] == state["type_patterns"]
+    assert "Number" in state2["type_patterns"]
+
+
+def test_parser_from_snapshot_with_match_group_type_converter():
+    def parse_decimal(text):
+        return float(text)
+    parse_decimal.pattern = r"\d+\.\d+"
+    parse_variant = TypeBuilder.make_variant([parse_number, parse_decimal])
+    extra_types = dict(NumberOrDecimal=parse_variant)
+    parser = parse.Parser("{:d} {value:NumberOrDecimal} {:d}", extra_types)
+    parser2 = parse.Parser.from_snapshot(parser.snapshot(), extra_types)
+    result = parser2.parse("1 2.5 3")
+    assert result.fixed == (1, 3)
+    assert result["value"] == 2.5
+
+
+def test_parser_from_snapshot_with_changed_type_pattern_is_rebuilt():
+    state = parse.Parser("{:Number}", dict(Number=parse_number)).snapshot()
+    def parse_word(text):
+        return text.upper()
+    parse_word.pattern = r"[a-z]+"
+    parser2 = parse.Parser.from_snapshot(state, dict(Number=parse_word))
+    assert parser2.parse("abc").fixed == ("ABC",)
+    assert parser2.parse("42") is None
+
+
+def test_parser_from_snapshot_keeps_options():
+    parser = parse.Parser("Name: {name}, {age:d}", case_sensitive=True,
+                          delimited=True)
+    parser2 = parse.Parser.from_snapshot(parser.snapshot())
+    assert parser2._options() == parser._options()
+    assert parser2.parse("Name: Alice, 42").named == {"name": "Alice", "age": 42}
+    assert parser2.parse("NAME: Alice, 42") is None
+
+
+def test_parser_from_snapshot_in_bytes_mode():
+    parser = parse.Parser(b"{name:w}={value:d}")
+    parser2 = parse.Parser.from_snapshot(parser.snapshot())
+    assert parser2.parse(b"answer=42").named == parser.parse(b"answer=42").named
+    assert parser2.parse(b"answer=42")["value"] == 42
+
+
+def test_parser_snapshot_with_stats_uses_plain_conversions():
+    parser = parse.Parser("{:d} {:Number}", dict(Number=parse_number))
+    parser.enable_stats()
+    state = parser.snapshot()
+    assert not isinstance(state["conversions"][0], parse.profiled_convert)
+    parser2 = parse.Parser.from_snapshot(state, dict(Number=parse_number))
+    assert parser2.parse("1 2").fixed == (1, 2)
+
+
+def test_parser_from_snapshot_raises_error_on_other_version():
+    state = parse.Parser("{:d}").snapshot()
+    state["version"] = 0
+    with pytest.raises(ValueError):
+        parse.Parser.from_snapshot(state)
+
+
+def test_save_and_load_snapshot(tmp_path):
+    extra_types = dict(Number=parse_number)
+    parsers = [parse.Parser(format, extra_types) for format in FORMATS]
+    filename = str(tmp_path / "parsers.snapshot")
+    parse.save_snapshot(parsers, filename)
+
+    parsers2 = parse.load_snapshot(filename, extra_types)
+    assert [p.format for p in parsers2] == FORMATS
+    for parser, parser2, text in zip(parsers, parsers2, TEXTS):
+        assert parser2.parse(text).named == parser.parse(text).named
+    when = parsers2[2].parse(TEXTS[2])["when"]
+    assert when == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_save_snapshot_with_cfparse_parser_raises_type_error(tmp_path):
+    parser = cfparse.Parser("{number:Number+}", dict(Number=parse_number))
+    filename = tmp_path / "parsers.snapshot"
+    with pytest.raises(TypeError):
+        parse.save_snapshot([parse.Parser("{:d}"), parser], str(filename))
+    assert not filename.exists()
@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the profiling hooks of :class:`parse_type.parse.Parser`
+(see: ``Parser.enable_stats()``, ``Parser.stats()``).
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+import pytest
+from parse_type import parse
+
+
+def parse_number(text):
+    return int(text)
+parse_number.pattern = r"\d+"
+
+
+def test_stats_are_disabled_by_default():
+    parser = parse.Parser("{:d}")
+    assert parser.stats() is None
+    assert parser._search_re.__class__.__name__ != "ProfiledPattern"
+
+
+def test_stats_per_field_and_converter():
+    parser = parse.Parser("{:d} {name:Number} {:d}", dict(Number=parse_number))
+    parser.enable_stats()
+    assert parser.parse("1 2 3").fixed == (1, 3)
+    assert parser.parse("x 2 3") is None
+    stats = parser.stats()
+    assert stats["regex"]["count"] == 2
+    assert stats["regex"]["failures"] == 1
+    assert stats["evaluate"]["count"] == 1
+    assert stats["fields"][0]["count"] == 1
+    assert stats["fields"][1]["count"] == 1
+    assert stats["fields"]["name"]["count"] == 1
+    assert stats["converters"]["d"]["count"] == 2
+    assert stats["converters"]["Number"]["count"] == 1
+    assert stats["converters"]["Number"]["time"] >= 0.0
+
+
+def test_stats_count_converter_failures():
+    def parse_bad(text):
+        raise ValueError(text)
+    parse_bad.pattern = r"\w+"
+
+    parser = parse.Parser("{value:Bad}", dict(Bad=parse_bad))
+    parser.enable_stats()
+    with pytest.raises(ValueError):
+        parser.parse("abc")
+    stats = parser.stats()
+    assert stats["fields"]["value"]["count"] == 1
+    assert stats["fields"]["value"]["failures"] == 1
+    assert stats["converters"]["Bad"]["failures"] == 1
+    assert stats["evaluate"]["failures"] == 1
+
+
+def test_stats_with_findall_and_reset():
+    parser = parse.Parser("<{:d}>")
+    parser.enable_stats()
+    assert [r[0] for r in parser.findall("<1> <2> <3>")] == [1, 2, 3]
+    stats = parser.stats(reset=True)
+    assert stats["converters"]["d"]["count"] == 3
+    assert stats["evaluate"]["count"] == 3
+    assert parser.stats()["converters"]["d"]["count"] == 0
+
+
+def test_export_stats_with_callback():
+    exported = []
+    parser = parse.Parser("{:d}")
+    parser.enable_stats(callback=exported.append, export_every=2)
+    for text in ("1", "2", "3", "4", "5"):
+        parser.parse(text)
+    assert [data["evaluate"]["count"] for data in exported] == [2, 4]
+
+    parser.export_stats()
+    assert exported[-1]["evaluate"]["count"] == 5
+    assert parser.stats()["evaluate"]["count"] == 0
+
+
+def test_disable_stats():
+    parser = parse.Parser("{:d}")
+    parser.enable_stats()
+    parser.disable_stats()
+    assert parser.stats() is None
+    assert parser.parse("42").fixed == (42,)
+    assert "evaluate_result" not in vars(parser)
+
+
+def test_parser_with_stats_can_be_pickled():
+    parser = parse.Parser("{:d}")
+    parser.enable_stats()
+    parser2 = pickle.loads(pickle.dumps(parser))
+    assert parser2.stats() is None
+    assert parser2.parse("42").fixed == (42,)
+
+
+def test_stats_keep_column_fast_path_and_result_factories(monkeypatch):
+    parser = parse.Parser("{:d} {:f}")
+    make_result = parser._make_result_factory(tuple)
+    parser.enable_stats()
+    assert parser._result_factories[tuple] is make_result
+
+    # -- FAST-PATH: Bulk conversion (without calling int_convert per value).
+    def fail(self, string, match):
+        raise AssertionError("OOPS: int_convert is called per value")
+    monkeypatch.setattr(parse.int_convert, "__call__", fail)
+    columns = parser.parse_columns(["1 2.5", "3 4.5"])
+    assert columns == {0: [1, 3], 1: [2.5, 4.5]}
+    stats = parser.stats()
+    assert stats["converters"]["d"]["count"] == 2
+    assert stats["fields"][1]["count"] == 2
@@ -0,0 +1,58 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :meth:`parse_type.parse.Parser.findall_stream()`.
+"""
+
+from __future__ import absolute_import, print_function
+import io
+import pytest
+from parse_type import parse
+
+TEXT = "".join("abc <%d|name%d> xyz\n" % (i, i) for i in range(200))
+
+
+def make_chunks(text, chunk_size):
+    return [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+def as_tuples(results):
+    return [(r.fixed, r.named, r.spans) for r in results]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 16, 1000, 100000])
+def test_findall_stream_with_file_is_same_as_findall(chunk_size):
+    parser = parse.Parser("<{:d}|{name:w}>")
+    expected = as_tuples(parser.findall(TEXT))
+    results = parser.findall_stream(io.StringIO(TEXT), chunk_size=chunk_size,
+                                    max_match_size=32)
+    assert as_tuples(results) == expected
+    assert len(expected) == 200
+
+
+@pytest.mark.parametrize("chunk_size", [3, 5, 64])
+def test_findall_stream_with_chunks_is_same_as_findall(chunk_size):
+    parser = parse.Parser("<{:d}|{name:w}>")
+    expected = as_tuples(parser.findall(TEXT))
+    chunks = make_chunks(TEXT, chunk_size)
+    results = parser.findall_stream(chunks, max_match_size=32)
+    assert as_tuples(results) == expected
+
+
+def test_findall_stream_uses_absolute_offsets():
+    parser = parse.Parser("<{:d}>")
+    results = list(parser.findall_stream(["xx <1", "2> yy <", "3>"],
+                                          max_match_size=4))
+    assert [r[0] for r in results] == [12, 3]
+    assert [r.spans[0] for r in results] == [(4, 6), (12, 13)]
+
+
+def test_findall_stream_with_result_type():
+    parser = parse.Parser("<{:d}|{name:w}>")
+    results = parser.findall_stream(make_chunks(TEXT[:100], 4),
+                                    max_match_size=32, result_type=tuple)
+    assert list(results)[:2] == [(0, "name0"), (1, "name1")]
+
+
+def test_findall_stream_with_empty_stream():
+    parser = parse.Parser("<{:d}>")
+    assert list(parser.findall_stream(io.StringIO(""))) == []
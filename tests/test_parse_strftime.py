@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the compiled strftime-style date/time type converters of
+:mod:`parse_type.parse` (values are taken from the regex sub-groups).
+"""
+
+from __future__ import absolute_import, print_function
+from datetime import datetime, timedelta, timezone
+import pytest
+from parse_type import parse
+from parse_type.parse import strftime_convert
+
+
+def strptime_convert(text, format):
+    # -- TEST ORACLE: Date/time conversion with datetime.strptime().
+    is_date = any("%" + x in format for x in "aAwdbBmyYjUW")
+    is_time = any("%" + x in format for x in "HIpMSfz")
+    dt = datetime.strptime(text, format)
+    if "%y" not in format and "%Y" not in format:
+        dt = dt.replace(year=parse.current_year())
+    if is_date and is_time:
+        return dt
+    elif is_date:
+        return dt.date()
+    return dt.time()
+
+
+@pytest.mark.parametrize("format, text", [
+    ("%Y-%m-%d", "1997-07-16"),
+    ("%Y-%b-%d", "1997-feb-16"),
+    ("%Y-%B-%d", "1997-February-16"),
+    ("%y%m%d", "690716"),
+    ("%y%m%d", "680716"),
+    ("%d/%m/%Y %H:%M:%S.%f", "16/07/1997 13:23:27.12"),
+    ("%Y-%m-%d %I:%M %p", "1997-07-16 12:30 AM"),
+    ("%Y-%m-%d %I:%M %p", "1997-07-16 12:30 pm"),
+    ("%Y-%m-%d %I:%M", "1997-07-16 12:30"),
+    ("%Y-%m-%d %H:%M:%S %z", "2023-11-21 13:23:27 -0130"),
+    ("%Y-%m-%d %H:%M:%S %z", "2023-11-21 13:23:27 +01:30:15"),
+    ("%Y/%j", "2024/60"),
+    ("%m.%d", "07.16"),
+    ("%H:%M", "13:23"),
+])
+def test_strftime_convert_equals_strptime(format, text):
+    parser = parse.Parser("{:%s}" % format)
+    converter = parser._type_conversions[0]
+    assert isinstance(converter, strftime_convert)
+    assert converter.directives is not None
+    result = parser.parse(text)
+    assert result.fixed[0] == strptime_convert(text, format)
+
+
+@pytest.mark.parametrize("format", [
+    "%a %Y-%m-%d", "%Y-%W", "%Y %Y", "%Y-%m-%d %j", "100%% %Y",
+])
+def test_strftime_convert_falls_back_to_strptime(format):
+    converter = strftime_convert(format)
+    assert converter.directives is None
+    assert converter.pattern == parse.get_regex_for_datetime_format(format)
+
+
+def test_strftime_convert_with_invalid_values_raises_error():
+    parser = parse.Parser("{:%Y-%m-%d}")
+    with pytest.raises(ValueError):
+        parser.parse("2023-13-01")
+
+
+def test_strftime_convert_with_other_fields():
+    parser = parse.Parser("{when:%Y-%m-%d %z} {:d} {size:d}")
+    result = parser.parse("2023-11-21 +0100 42 512")
+    tz = timezone(timedelta(hours=1))
+    assert result.named["when"] == datetime(2023, 11, 21, tzinfo=tz)
+    assert result.fixed == (42,)
+    assert result.named["size"] == 512
+
+
+def test_strftime_convert_with_literal_dot():
+    parser = parse.Parser("{:%Y.%m}")
+    assert parser.parse("2023x11") is None
+    assert parser.parse("2023.11").fixed == (datetime(2023, 11, 1).date(),)
@@ -0,0 +1,59 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for the interned :class:`parse_type.parse.FixedTzOffset` instances.
+"""
+
+from __future__ import absolute_import, print_function
+from datetime import datetime
+import copy
+import pickle
+from parse_type import parse
+from parse_type.parse import FixedTzOffset
+
+
+def test_fixed_tz_offset_get_returns_shared_instance():
+    tz1 = FixedTzOffset.get(60, "+01:00")
+    tz2 = FixedTzOffset.get(60, "+01:00")
+    assert tz1 is tz2
+    assert tz1 == FixedTzOffset(60, "+01:00")
+    assert FixedTzOffset.get(60, "+0100") is not tz1
+
+
+def test_fixed_tz_offset_uses_slots():
+    tz = FixedTzOffset(-90, "-01:30")
+    assert not hasattr(tz, "__dict__")
+
+
+def test_fixed_tz_offset_is_hashable():
+    tz1 = FixedTzOffset(60, "+01:00")
+    tz2 = FixedTzOffset(60, "+01:00")
+    assert hash(tz1) == hash(tz2)
+    assert len({tz1, tz2}) == 1
+
+
+def test_fixed_tz_offset_can_be_pickled_and_copied():
+    tz = FixedTzOffset(-90, "-01:30")
+    assert pickle.loads(pickle.dumps(tz)) == tz
+    assert copy.deepcopy(tz) == tz
+    dt = datetime(2023, 1, 2, 3, 4, tzinfo=tz)
+    assert pickle.loads(pickle.dumps(dt)) == dt
+
+
+def test_parsed_datetimes_share_tzinfo_objects():
+    parser = parse.Parser("{:tg}")
+    result1 = parser.parse("16/7/1997 19:20 +01:00")
+    result2 = parser.parse("1/1/2023 00:00 +01:00")
+    assert result1.fixed[0].tzinfo is result2.fixed[0].tzinfo
+
+
+def test_strftime_and_iso_datetimes_share_tzinfo_objects():
+    parser = parse.Parser("{:%Y-%m-%d %z} {:ti}")
+    result = parser.parse("2023-11-21 +01:00 1997-07-16T19:20+01:00")
+    assert result.fixed[0].tzinfo is FixedTzOffset.get(60, "+01:00")
+    assert result.fixed[0].tzinfo is result.fixed[1].tzinfo
+
+
+def test_strftime_timezone_with_seconds():
+    parser = parse.Parser("{:%Y-%m-%d %z}")
+    expected = datetime.strptime("2023-11-21 -01:30:15", "%Y-%m-%d %z")
+    assert parser.parse("2023-11-21 -01:30:15").fixed[0] == expected
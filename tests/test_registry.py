@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :mod:`parse_type.registry` and the pickle support of
+type converters that are built by the :class:`parse_type.TypeBuilder`.
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+import pytest
+from parse_type import TypeBuilder
+from parse_type import parse
+from parse_type.registry import TypeRegistry, TypeVariantCache, \
+    type_registry, register_type
+from .parse_type_test import parse_number, parse_yesno, parse_color, \
+    parse_person_choice, Color
+
+
+def pickled(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.fixture
+def registered_types():
+    yield type_registry
+    type_registry.clear()
+
+
+class TestTypeRegistry(object):
+    def test_register_and_lookup(self):
+        registry = TypeRegistry()
+        registry.register("Number", parse_number)
+        assert "Number" in registry
+        assert registry.lookup("Number") is parse_number
+        assert registry.name_of(parse_number) == "Number"
+
+    def test_register_replaces_type(self):
+        registry = TypeRegistry()
+        registry.register("Number", parse_number)
+        registry.register("Number", parse_yesno)
+        assert registry.lookup("Number") is parse_yesno
+        assert registry.name_of(parse_number) is None
+
+    def test_unregister(self):
+        registry = TypeRegistry()
+        registry.register_types(dict(Number=parse_number))
+        registry.unregister("Number")
+        assert "Number" not in registry
+        with pytest.raises(KeyError):
+            registry.lookup("Number")
+
+
+class TestTypeRegistryWithManyNames(object):
+    def test_unregister_one_name_keeps_other_name(self):
+        registry = TypeRegistry()
+        registry.register("Number", parse_number)
+        registry.register("Integer", parse_number)
+        assert registry.name_of(parse_number) == "Number"
+        registry.unregister("Number")
+        assert registry.name_of(parse_number) == "Integer"
+        registry.unregister("Integer")
+        assert registry.name_of(parse_number) is None
+
+    def test_name_of_uses_identity_of_converter(self):
+        class EqualConverter(object):
+            def __call__(self, text):
+                return text
+            def __eq__(self, other):
+                return isinstance(other, EqualConverter)
+            __hash__ = None     # -- UNHASHABLE
+
+        converter1 = EqualConverter()
+        registry = TypeRegistry()
+        registry.register("Text", converter1)
+        assert registry.name_of(converter1) == "Text"
+        assert registry.name_of(EqualConverter()) is None
+
+
+class TestTypeVariantCache(object):
+    def test_get_or_create_builds_variant_once(self):
+        cache = TypeVariantCache()
+        calls = []
+        def make_variant():
+            calls.append(1)
+            return TypeBuilder.with_many(parse_number)
+
+        key = (parse_number, "many", ",")
+        variant1 = cache.get_or_create(key, make_variant)
+        variant2 = cache.get_or_create(key, make_variant)
+        assert variant1 is variant2
+        assert len(calls) == 1
+        assert len(cache) == 1
+
+    def test_get_or_create_with_unhashable_key_is_not_cached(self):
+        cache = TypeVariantCache()
+        variant = cache.get_or_create(([], "many"), lambda: parse_number)
+        assert variant is parse_number
+        assert len(cache) == 0
+
+    def test_cache_is_cleared_when_full(self):
+        cache = TypeVariantCache(maxsize=2)
+        for index in range(3):
+            cache.get_or_create(index, lambda: parse_number)
+        assert len(cache) == 1
+
+
+class TestPickleTypeConverter(object):
+    @pytest.mark.parametrize("type_converter, text, expected", [
+        (TypeBuilder.with_optional(parse_number), "12", 12),
+        (TypeBuilder.with_many0(parse_number), "1, 2", [1, 2]),
+        (TypeBuilder.with_many(parse_number, listsep=";"), "1; 2", [1, 2]),
+        (parse_yesno, "yes", True),
+        (parse_color, "red", Color.red),
+        (parse_person_choice, "Alice", "Alice"),
+        (TypeBuilder.make_choice2(["a", "b"]), "b", (1, "b")),
+        (TypeBuilder.make_variant([parse_number, parse_yesno]), "no", False),
+        (TypeBuilder.make_variant([parse_number, parse_color], compiled=True),
+         "blue", Color.blue),
+    ])
+    def test_pickle_type_converter(self, type_converter, text, expected):
+        type_converter2 = pickled(type_converter)
+        assert type_converter2.pattern == type_converter.pattern
+        assert type_converter2(text) == expected
+
+    def test_pickle_keeps_type_converter_name(self):
+        parse_numbers = TypeBuilder.with_many(parse_number)
+        parse_numbers.name = "Number+"
+        assert pickled(parse_numbers).name == "Number+"
+
+    def test_pickle_registered_lambda_by_name(self, registered_types):
+        parse_word = lambda text: text.upper()
+        parse_word.pattern = r"\w+"
+        register_type("Word", parse_word)
+        parse_words = pickled(TypeBuilder.with_many(parse_word))
+        assert parse_words.converter is parse_word
+        assert parse_words("a, b") == ["A", "B"]
+
+    def test_pickle_parser_with_registered_types(self, registered_types):
+        parse_word = lambda text: text.upper()
+        parse_word.pattern = r"\w+"
+        register_type("Word", parse_word)
+        extra_types = dict(Words=TypeBuilder.with_many(parse_word))
+        parser = pickled(parse.Parser("Hello {names:Words}", extra_types))
+        assert parser.parse("Hello alice, bob")["names"] == ["ALICE", "BOB"]